@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+import io
+import os
+import sys
+import tempfile
+import timeit
+
+from klvdata.klvparser import KLVParser
+
+# Best of five times framing every triplet of a recording from each source type.
+if __name__ == "__main__":
+	path = sys.argv[1] if len(sys.argv) > 1 else './data/DynamicConstantMISMMSPacketData.bin'
+	copies = 40000
+
+	with open(path, 'rb') as f:
+		data = f.read() * copies
+
+	with tempfile.NamedTemporaryFile(delete=False) as f:
+		f.write(data)
+
+	sources = [
+		('bytes', lambda: data),
+		('BytesIO', lambda: io.BytesIO(data)),
+		('open', lambda: open(f.name, 'rb')),
+		('FileIO', lambda: io.FileIO(f.name)),
+	]
+
+	def frame(source):
+		for _ in KLVParser(source, 16):
+			pass
+
+		if hasattr(source, 'close'):
+			source.close()
+
+	try:
+		for name, source in sources:
+			elapsed = min(timeit.repeat(lambda: frame(source()), number=1, repeat=5))
+			print('{} packets from {}: {:.3f} s'.format(copies, name, elapsed))
+	finally:
+		os.remove(f.name)
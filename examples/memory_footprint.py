@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+
+import sys
+import tracemalloc
+
+import klvdata
+
+# Approximate memory held per parsed packet, for comparing element representations.
+if __name__ == "__main__":
+	path = sys.argv[1] if len(sys.argv) > 1 else './data/DynamicConstantMISMMSPacketData.bin'
+	copies = 10000
+
+	with open(path, 'rb') as f:
+		data = f.read() * copies
+
+	tracemalloc.start()
+	start = tracemalloc.get_traced_memory()[0]
+	packets = [packet for packet in klvdata.StreamParser(data)]
+	size = tracemalloc.get_traced_memory()[0] - start
+	tracemalloc.stop()
+
+	print('{} packets, {:.0f} bytes per packet'.format(len(packets), size / len(packets)))
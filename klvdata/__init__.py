@@ -1,4 +1,9 @@
 from .streamparser import StreamParser
+from .streamparser import FeedParser
+from .streamparser import AsyncStreamParser
+from .klvfile import KLVFile
+from .statetracker import StateTracker
+from .packetbuilder import UASPacketBuilder
 from . import misb0601
 from . import misb0102
 from . import misbEG0104                        
\ No newline at end of file
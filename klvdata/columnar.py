@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Batch operations over whole buffers of KLV packets using NumPy arrays.
+
+NumPy is an optional dependency of klvdata and is only required by this module.
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+
+import numpy as np
+from klvdata.common import ber_encode
+from klvdata.common import is_subclass
+from klvdata.common import str_to_bytes
+from klvdata.elementparser import DateTimeElementParser
+from klvdata.elementparser import StringElementParser
+from klvdata.klvparser import UNIVERSAL_LABEL_PREFIX
+from klvdata.misb0601 import UASLocalMetadataSet
+from klvdata.setparser import SetParser
+
+# Longest BER long form length decoded, keeping lengths within int64.
+_MAX_LENGTH_BYTES = 7
+
+
+def frame_array(buffer, key_length=16, prefix=UNIVERSAL_LABEL_PREFIX):
+    """Return arrays of key offsets, value offsets and value lengths of top level packets in buffer.
+
+    Every position where prefix occurs is a candidate packet start. The BER
+    lengths of all candidates are decoded at once, then packets are chained
+    from the start of the buffer by following each packet's end to the next
+    candidate. As with KLVParser sync mode, a candidate is only accepted if its
+    header and value are complete and it is followed by prefix or the end of
+    the buffer, so framing resumes at the next prefix after corruption.
+
+    buffer may be any object supporting the buffer protocol (bytes, mmap, ...).
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    size = len(data)
+    window = size - key_length
+
+    if window <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy(), empty.copy()
+
+    # Positions of the first prefix byte, narrowed by each following byte.
+    starts = np.flatnonzero(data[:window] == prefix[0]).astype(np.int64)
+    for i, byte in enumerate(prefix[1:], 1):
+        starts = starts[data[starts + i] == byte]
+
+    first = data[starts + key_length].astype(np.int64)
+    long_form = first >= 128
+    count = np.where(long_form, first - 128, 0)
+    header = key_length + 1 + count
+
+    valid = (count <= _MAX_LENGTH_BYTES) & (starts + header <= size)
+
+    # BER Short Form lengths are the first byte, Long Form lengths follow it.
+    lengths = np.where(long_form, 0, first)
+    for i in range(_MAX_LENGTH_BYTES):
+        select = np.flatnonzero(valid & (count > i))
+        lengths[select] = (lengths[select] << 8) | data[starts[select] + key_length + 1 + i]
+
+    ends = starts + header + lengths
+    valid &= ends <= size
+
+    successors = np.searchsorted(starts, ends)
+    followed = np.zeros(len(starts), dtype=bool)
+    inside = successors < len(starts)
+    followed[inside] = starts[successors[inside]] == ends[inside]
+    valid &= followed | (size - ends < len(prefix))
+
+    # Runs of valid candidates each followed by the next candidate are taken
+    # whole. Candidates breaking a run are walked one at a time.
+    count = len(starts)
+    breaks = np.flatnonzero(~(valid & (successors == np.arange(1, count + 1)))).tolist()
+    successors = successors.tolist()
+    valid = valid.tolist()
+
+    runs = []
+    index = 0
+    while index < count:
+        position = bisect_left(breaks, index)
+        stop = breaks[position] if position < len(breaks) else count
+        runs.append(np.arange(index, stop))
+
+        if stop == count:
+            break
+
+        if valid[stop]:
+            runs.append(np.array([stop]))
+            index = successors[stop]
+        else:
+            index = stop + 1
+
+    chain = np.concatenate(runs).astype(np.int64) if runs else np.empty(0, dtype=np.int64)
+
+    return starts[chain], starts[chain] + header[chain], lengths[chain]
+
+
+def decode(buffer, set_parser=UASLocalMetadataSet):
+    """Return OrderedDict of item key to masked array of the item value in every set_parser packet of buffer.
+
+    Packets are framed with frame_array and only those with the set_parser key
+    are decoded. Items of all packets are framed together, then each item key
+    is converted as a whole column:
+
+        Mapped elements     float64, using the element _domain, _range and _error
+        Time stamps         int64 microseconds
+        Strings, bytes      object, each distinct value decoded once
+        Other items         object, as returned by set_parser.decode
+
+    Values are masked for packets without the item. Mapped values are also
+    masked for the error value and values outside the domain or range, which
+    set_parser.decode returns as None or bytes. Floating point results are the
+    same as set_parser.decode.
+
+    set_parser must use single byte keys.
+    """
+    if getattr(set_parser, 'key_length', 1) != 1:
+        raise ValueError('set_parser must use single byte keys')
+
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    key_offsets, value_offsets, value_lengths = frame_array(buffer)
+
+    key = np.frombuffer(bytes(set_parser.key), dtype=np.uint8)
+    select = (data[key_offsets[:, None] + np.arange(len(key))] == key).all(axis=1)
+
+    starts = value_offsets[select]
+    count = len(starts)
+    rows, keys, offsets, lengths = _frame_items(data, starts, starts + value_lengths[select])
+
+    decoders = set_parser.__dict__.get('_decoders') or set_parser.compile()
+
+    columns = OrderedDict()
+
+    tags, first = np.unique(keys, return_index=True)
+    for tag in tags[np.argsort(first)].tolist():
+        item_key = bytes([tag])
+        items = np.flatnonzero(keys == tag)
+        parser = set_parser.parsers.get(item_key)
+        mapping = getattr(parser, '__dict__', {}).get('_mapping')
+
+        if mapping is not None and _fixed_width(lengths[items], 8):
+            column = _mapped_column(data, offsets[items], lengths[items], mapping)
+        elif is_subclass(parser, DateTimeElementParser) and _fixed_width(lengths[items], 8, 8):
+            column = _read_ints(data, offsets[items], lengths[items], signed=False).view(np.int64), None
+        else:
+            decoder = decoders.get(item_key, bytes)
+            column = _object_column(
+                data, offsets[items], lengths[items], decoder,
+                cache=decoder is bytes or is_subclass(parser, StringElementParser))
+
+        values, valid = column
+
+        array = np.ma.masked_all(count, dtype=values.dtype)
+        if valid is None:
+            array[rows[items]] = values
+        else:
+            array[rows[items][valid]] = values[valid]
+
+        columns[item_key] = array
+
+    return columns
+
+
+def encode(columns, set_parser=UASLocalMetadataSet):
+    """Return bytes of a KLV stream of set_parser packets, one per row of columns.
+
+    columns maps item keys (bytes as returned by decode, or tag numbers) to
+    arrays of equal length. Items are written in the order of columns and
+    followed by the checksum item if set_parser has a checksum_key. A
+    checksum column, as returned by decode, is left out and the checksum is
+    computed instead, so that encode(decode(buffer)) re-encodes buffer.
+    Values are converted by item, each column as a whole where possible:
+
+        Mapped elements     float, converted with the element _domain, _range
+                            and _error. NaN is the error value.
+        Time stamps         integer microseconds or datetime64
+        Strings             str
+        Nested sets         dictionary of item key to value, as above
+        Other items         bytes of the encoded value
+
+    Masked values of masked arrays are left out of their packet. Mapped values
+    outside the range, or NaN without an error value, raise ValueError as
+    LinearMapping.encode does. Fixed point results are the same as
+    LinearMapping.encode.
+
+    set_parser must use single byte keys.
+    """
+    if getattr(set_parser, 'key_length', 1) != 1:
+        raise ValueError('set_parser must use single byte keys')
+
+    checksum_key = getattr(set_parser, 'checksum_key', None)
+
+    columns = [(bytes([key]) if isinstance(key, int) else bytes(key), column) for key, column in columns.items()]
+    columns = [(key, column) for key, column in columns if key != checksum_key]
+
+    counts = {len(column) for key, column in columns}
+    if len(counts) > 1:
+        raise ValueError('columns differ in length')
+    count = counts.pop() if counts else 0
+
+    if not count:
+        return b''
+
+    # Value lengths of the packets, summed while the items are encoded.
+    lengths = np.zeros(count, dtype=np.int64)
+    items = []
+
+    for key, column in columns:
+        rows = np.flatnonzero(~np.ma.getmaskarray(column))
+        values = np.ma.getdata(column)[rows]
+
+        parser = set_parser.parsers.get(key)
+        mapping = getattr(parser, '__dict__', {}).get('_mapping')
+
+        if mapping is not None and mapping.format is not None:
+            data = _mapped_bytes(values, mapping)
+        elif is_subclass(parser, DateTimeElementParser):
+            values = np.asarray(values)
+            if np.issubdtype(values.dtype, np.datetime64):
+                values = values.astype('datetime64[us]').view(np.int64)
+            data = values.astype('>u8').view(np.uint8).reshape(-1, 8)
+        else:
+            if is_subclass(parser, SetParser):
+                # Each nested set is encoded as a stream of one packet, which
+                # is its item with the nested set key.
+                data = [_nested_item(value, parser) for value in values.tolist()]
+            else:
+                if is_subclass(parser, StringElementParser):
+                    convert = str_to_bytes
+                elif mapping is not None:
+                    convert = mapping.encode
+                else:
+                    convert = bytes
+
+                data = [convert(value) for value in values.tolist()]
+                data = [key + ber_encode(len(value)) + value for value in data]
+
+            items.append((rows, data))
+            lengths[rows] += [len(item) for item in data]
+            continue
+
+        # Fixed width items, tag and length header then value.
+        header = np.frombuffer(key + bytes([data.shape[1]]), dtype=np.uint8)
+        data = np.hstack([np.broadcast_to(header, (len(rows), len(header))), data])
+
+        items.append((rows, data))
+        lengths[rows] += data.shape[1]
+
+    if checksum_key is not None:
+        lengths += 4
+
+    # BER Short Form below 128, else Long Form with the bytes of the length.
+    long_form = lengths >= 128
+    length_bytes = sum((lengths >> (8 * i)) > 0 for i in range(8))
+    header_sizes = len(set_parser.key) + 1 + np.where(long_form, length_bytes, 0)
+
+    ends = np.cumsum(header_sizes + lengths)
+    starts = ends - header_sizes - lengths
+
+    stream = np.zeros(int(ends[-1]), dtype=np.uint8)
+
+    key = np.frombuffer(bytes(set_parser.key), dtype=np.uint8)
+    stream[starts[:, None] + np.arange(len(key))] = key
+
+    position = starts + len(key)
+    stream[position] = np.where(long_form, 128 + length_bytes, lengths)
+    for i in range(int(length_bytes[long_form].max()) if long_form.any() else 0):
+        select = np.flatnonzero(long_form & (length_bytes > i))
+        shift = 8 * (length_bytes[select] - 1 - i)
+        stream[position[select] + 1 + i] = (lengths[select] >> shift) & 0xFF
+
+    cursor = starts + header_sizes
+
+    for rows, data in items:
+        if isinstance(data, list):
+            for offset, item in zip(cursor[rows].tolist(), data):
+                stream[offset:offset + len(item)] = np.frombuffer(item, dtype=np.uint8)
+            cursor[rows] += [len(item) for item in data]
+        else:
+            stream[cursor[rows][:, None] + np.arange(data.shape[1])] = data
+            cursor[rows] += data.shape[1]
+
+    if checksum_key is not None:
+        stream[cursor] = checksum_key[0]
+        stream[cursor + 1] = 2
+
+        checksums = _checksums(stream, starts, cursor + 2)
+        stream[cursor + 2] = checksums >> np.uint64(8)
+        stream[cursor + 3] = checksums & np.uint64(0xFF)
+
+    return stream.tobytes()
+
+
+def _nested_item(values, set_parser):
+    """Return bytes of the item of nested set_parser holding values, a dictionary of item key to value."""
+    if not isinstance(values, dict):
+        raise TypeError('values of {} must be dictionaries'.format(set_parser.name))
+
+    columns = OrderedDict()
+    for key, value in values.items():
+        column = np.empty(1, dtype=object)
+        column[0] = value
+        columns[key] = column
+
+    return encode(columns, set_parser) or bytes(set_parser.key) + b'\x00'
+
+
+def _mapped_bytes(values, mapping):
+    """Return uint8 array of the big endian fixed point bytes of values, one row per value.
+
+    Uses the same operations as LinearMapping.encode_int, so results are equal.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    error = np.isnan(values)
+
+    if error.any() and mapping.error is None:
+        raise ValueError('no error value for NaN')
+
+    values = values[~error]
+    if not ((mapping.dst_min <= values) & (values <= mapping.dst_max)).all():
+        raise ValueError('value out of range')
+
+    src_values = mapping.inverse_slope * (values - mapping.dst_min) + mapping.src_min
+    if not ((mapping.src_min <= src_values) & (src_values <= mapping.src_max)).all():
+        raise ValueError('value out of domain')
+
+    fixed = np.full(len(error), mapping.error if mapping.error is not None else 0, dtype=np.int64)
+    fixed[~error] = np.round(src_values)
+
+    return fixed.astype('>' + mapping.format).view(np.uint8).reshape(-1, mapping.length)
+
+
+def checksum_valid(buffer, key_offsets=None, value_offsets=None, value_lengths=None):
+    """Return boolean array telling for each packet whether its last item is a matching checksum.
+
+    The checksum is that of UAS Local Sets (MISB ST0601 tag 1), as computed by
+    common.packet_checksum. Packets are those framed by frame_array unless
+    their offsets and lengths are given, sorted and not overlapping.
+
+    Word sums of all packets are taken in two passes over the even and odd
+    bytes of buffer, without copying it.
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+
+    if key_offsets is None:
+        key_offsets, value_offsets, value_lengths = frame_array(buffer)
+
+    if not len(key_offsets):
+        return np.zeros(0, dtype=bool)
+
+    ends = value_offsets + value_lengths
+    valid = value_lengths >= 4
+
+    # The checksum covers the packet up to its own two byte value.
+    checksums = _checksums(data, key_offsets, ends - 2)
+
+    tail = np.where(valid, ends, 4)
+    stored = (data[tail - 2].astype(np.uint64) << np.uint64(8)) | data[tail - 1]
+
+    valid &= (data[tail - 4] == 1) & (data[tail - 3] == 2)
+    valid &= stored == checksums
+
+    return valid
+
+
+def _checksums(data, starts, stops):
+    """Return uint64 array of the 16 bit word sums of data[start:stop], as common.packet_checksum."""
+    # Bytes at even and odd positions of data within [start, stop).
+    even = _range_sums(data[0::2], (starts + 1) // 2, (stops + 1) // 2)
+    odd = _range_sums(data[1::2], starts // 2, stops // 2)
+
+    # Words are aligned on the packet start, their first byte is the high byte.
+    aligned = starts % 2 == 0
+    high = np.where(aligned, even, odd)
+    low = np.where(aligned, odd, even)
+
+    return ((high << np.uint64(8)) + low) & np.uint64(0xFFFF)
+
+
+def _range_sums(values, starts, stops):
+    """Return uint64 sums of values[start:stop] for sorted, non overlapping, non empty ranges."""
+    indices = np.empty(2 * len(starts), dtype=np.int64)
+    indices[0::2] = starts
+    indices[1::2] = stops
+
+    # The sum of the last range runs to the end of values if its stop is the end.
+    if indices[-1] >= len(values):
+        indices = indices[:-1]
+
+    return np.add.reduceat(values, indices, dtype=np.uint64)[0::2]
+
+
+def _frame_items(data, starts, ends):
+    """Return arrays of packet index, key, value offset and value length of the items of all packets.
+
+    Items of all packets are framed together, one item position per step, as
+    SetParser.decode frames single byte keys. Framing of a packet stops at an
+    item with an incomplete length or value.
+    """
+    rows, keys, offsets, lengths = [], [], [], []
+
+    index = np.arange(len(starts))
+    cursor = starts.copy()
+
+    while True:
+        live = cursor + 1 < ends
+        index, cursor, ends = index[live], cursor[live], ends[live]
+
+        if not len(index):
+            break
+
+        first = data[cursor + 1].astype(np.int64)
+        long_form = first >= 128
+        count = np.where(long_form, first - 128, 0)
+        start = cursor + 2 + count
+
+        valid = (count <= _MAX_LENGTH_BYTES) & (start <= ends)
+
+        # BER Short Form lengths are the first byte, Long Form lengths follow it.
+        length = np.where(long_form, 0, first)
+        for i in range(_MAX_LENGTH_BYTES):
+            select = np.flatnonzero(valid & (count > i))
+            length[select] = (length[select] << 8) | data[cursor[select] + 2 + i]
+
+        valid &= start + length <= ends
+
+        index, cursor, ends, start, length = index[valid], cursor[valid], ends[valid], start[valid], length[valid]
+
+        rows.append(index)
+        keys.append(data[cursor])
+        offsets.append(start)
+        lengths.append(length)
+
+        cursor = start + length
+
+    if not rows:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, np.empty(0, dtype=np.uint8), empty.copy(), empty.copy()
+
+    # Items in buffer order, so later duplicates of a key in a packet take precedence.
+    offsets = np.concatenate(offsets)
+    order = np.argsort(offsets, kind='stable')
+
+    return np.concatenate(rows)[order], np.concatenate(keys)[order], offsets[order], np.concatenate(lengths)[order]
+
+
+def _fixed_width(lengths, maximum, minimum=1):
+    """Return True if all lengths are within minimum and maximum bytes."""
+    return minimum <= lengths.min() and lengths.max() <= maximum
+
+
+def _read_ints(data, offsets, lengths, signed):
+    """Return uint64 array of the big endian integers of lengths bytes at offsets, sign extended if signed."""
+    values = np.zeros(len(offsets), dtype=np.uint64)
+
+    for i in range(int(lengths.max())):
+        select = np.flatnonzero(lengths > i)
+        values[select] = (values[select] << np.uint64(8)) | data[offsets[select] + i]
+
+    if signed:
+        shift = (64 - 8 * lengths).astype(np.uint64)
+        values = ((values << shift).view(np.int64) >> shift.astype(np.int64)).view(np.uint64)
+
+    return values
+
+
+def _mapped_column(data, offsets, lengths, mapping):
+    """Return float64 values and valid flags of fixed point values converted with mapping.
+
+    Uses the same operations as LinearMapping.decode_int, so results are equal.
+    """
+    src_values = _read_ints(data, offsets, lengths, mapping.signed).view(np.int64)
+    values = mapping.slope * (src_values - mapping.src_min).astype(np.float64) + mapping.dst_min
+
+    valid = (mapping.src_min <= src_values) & (src_values <= mapping.src_max)
+    valid &= (mapping.dst_min <= values) & (values <= mapping.dst_max)
+
+    if mapping.error is not None:
+        valid &= src_values != mapping.error
+
+    return values, valid
+
+
+def _object_column(data, offsets, lengths, decoder, cache=False):
+    """Return object values decoded one by one, as SetParser.decode does.
+
+    If cache, values are decoded once per distinct bytes and shared.
+    """
+    values = np.empty(len(offsets), dtype=object)
+    decoded = {}
+
+    for i, (offset, length) in enumerate(zip(offsets.tolist(), lengths.tolist())):
+        value = data[offset:offset + length].tobytes()
+
+        if cache and value in decoded:
+            values[i] = decoded[value]
+            continue
+
+        try:
+            result = decoder(value)
+        except (TypeError, ValueError):
+            result = value
+
+        values[i] = result
+        if cache:
+            decoded[value] = result
+
+    return values, None
@@ -26,17 +26,43 @@
 from struct import pack
 from struct import unpack
 from datetime import datetime
+from datetime import timedelta
 from datetime import timezone
 from binascii import hexlify, unhexlify
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
 def datetime_to_bytes(value):
     """Return bytes representing UTC time in microseconds."""
-    return pack('>Q', int(value.timestamp() * 1e6))
+    return pack('>Q', datetime_to_microseconds(value))
 
 
 def bytes_to_datetime(value):
     """Return datetime from microsecond bytes."""
-    return datetime.fromtimestamp(bytes_to_int(value)/1e6, tz=timezone.utc)
+    return microseconds_to_datetime(bytes_to_int(value))
+
+
+def datetime_to_microseconds(value):
+    """Return integer UTC time in microseconds from datetime, without floating point rounding.
+
+    Naive datetimes are taken as local time, as datetime.timestamp does.
+    """
+    if value.tzinfo is None or value.utcoffset() is None:
+        # Python 3.5 astimezone rejects naive datetimes. Whole seconds are
+        # exact as float, and timestamp honours fold.
+        return round(value.replace(microsecond=0).timestamp()) * 1000000 + value.microsecond
+
+    return (value.astimezone(timezone.utc) - EPOCH) // MICROSECOND
+
+
+def microseconds_to_datetime(value):
+    """Return datetime from integer UTC time in microseconds, without floating point rounding."""
+    try:
+        return EPOCH + timedelta(microseconds=value)
+    except OverflowError:
+        raise ValueError('time stamp out of range: {}'.format(value))
 
 
 def bytes_to_int(value, signed=False):
@@ -77,6 +103,11 @@ def ber_encode(value):
         return int_to_bytes(byte_length + 128) + int_to_bytes(value, length=byte_length)
 
 
+def is_subclass(value, base):
+    """Return True if value is a class derived from base, False for any other value."""
+    return isinstance(value, type) and issubclass(value, base)
+
+
 def bytes_to_str(value):
     """Return UTF-8 formatted string from bytes object."""
     return bytes(value).decode('UTF-8')
@@ -160,14 +191,81 @@ def float_to_bytes(value, _domain, _range, _error=None):
     return round(dst_value).to_bytes(length, byteorder='big', signed=(dst_min < 0))
 
 
-def packet_checksum(data):
-    """Return two byte checksum from a SMPTE ST 336 KLV structured bytes object."""
-    length = len(data) - 2
-    word_size, mod = divmod(length, 2)
+class LinearMapping(object):
+    """Precomputed linear mapping between fixed point and floating point values.
+
+    Holds the slopes, signedness and byte length used by bytes_to_float and
+    float_to_bytes for a given _domain, _range and _error, so that decoding
+    and encoding are a single multiply-add. Results and errors are the same
+    as bytes_to_float and float_to_bytes.
+    """
+    def __init__(self, _domain, _range, _error=None):
+        self.src_min, self.src_max = _domain
+        self.dst_min, self.dst_max = _range
+        self.error = _error
+
+        self.signed = min(_domain) < 0
+        self.length = int((self.src_max - self.src_min - 1).bit_length() / 8)
+
+        self.slope = (self.dst_max - self.dst_min) / (self.src_max - self.src_min)
+        self.inverse_slope = (self.src_max - self.src_min) / (self.dst_max - self.dst_min)
+
+        # struct format character of the fixed point integer, if there is one.
+        self.format = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}.get(self.length)
+        if self.format is not None and not self.signed:
+            self.format = self.format.upper()
 
-    words = sum(unpack(">{:d}H".format(word_size), data[0:length - mod]))
+    def decode(self, value):
+        """Return floating point value from fixed point bytes, or None for the error value."""
+        return self.decode_int(int.from_bytes(value, byteorder='big', signed=self.signed))
+
+    def decode_int(self, src_value):
+        """Return floating point value from fixed point integer, or None for the error value."""
+        if src_value == self.error:
+            return None
+
+        if not (self.src_min <= src_value <= self.src_max):
+            raise ValueError
+
+        dst_value = self.slope * (src_value - self.src_min) + self.dst_min
+
+        if not (self.dst_min <= dst_value <= self.dst_max):
+            raise ValueError
+
+        return dst_value
+
+    def encode(self, value):
+        """Return fixed point bytes from floating point value, or the error value for None."""
+        return self.encode_int(value).to_bytes(self.length, byteorder='big', signed=self.signed)
+
+    def encode_int(self, value):
+        """Return fixed point integer from floating point value, or the error value for None."""
+        if value is None:
+            src_value = self.error
+        else:
+            if not (self.dst_min <= value <= self.dst_max):
+                raise ValueError
+
+            src_value = self.inverse_slope * (value - self.dst_min) + self.src_min
+
+            if not (self.src_min <= src_value <= self.src_max):
+                raise ValueError
+
+        return round(src_value)
+
+
+def packet_checksum(data, prefix=b''):
+    """Return two byte checksum from a SMPTE ST 336 KLV structured bytes object.
+
+    If prefix is given, the checksum is that of prefix followed by data,
+    computed without joining them.
+    """
+    length = len(data) - 2
+    odd = len(prefix) % 2
 
-    if mod:
-        words += data[length - 1] << 8
+    # The sum of big endian words is the sum of their high bytes shifted plus
+    # the sum of their low bytes. A trailing odd byte is a high byte.
+    words = (sum(prefix[0::2]) << 8) + sum(prefix[1::2])
+    words += (sum(data[odd:length:2]) << 8) + sum(data[1 - odd:length:2])
 
     return pack('>H', words & 0xFFFF)
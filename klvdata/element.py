@@ -25,6 +25,7 @@
 
 from abc import ABCMeta
 from abc import abstractmethod
+from types import MemberDescriptorType
 from klvdata.common import ber_encode
 
 
@@ -37,6 +38,11 @@ class Element(metaclass=ABCMeta):
 
     The length is dynamically calculated based off the value.
 
+    value, and the value as constructed to detect changes, have a slot. The
+    library's own subclasses declare empty __slots__, or a key slot as
+    UnknownElement does, so their instances have no __dict__. Subclasses
+    without __slots__ get a __dict__ for their other attributes as usual.
+
     Attributes:
         key
         value
@@ -44,16 +50,40 @@ class Element(metaclass=ABCMeta):
     Properties:
         name: If name is set return name, else return class name.
         length: Length is calculated based off value.
+        modified: True if the value was changed since it was parsed.
     """
+    __slots__ = ('value', '_parsed')
 
     def __init__(self, key, value):
         self.key = key
-        self.value = value
+        self.value = self._parsed = value
+
+    def __getstate__(self):
+        """Return dictionary of the set slots and __dict__ attributes for pickling.
+
+        Slots shadowed by a class attribute (key_length of most sets) cannot be
+        set on instances and are left out.
+        """
+        cls = type(self)
+        state = {slot: getattr(self, slot)
+                 for base in cls.__mro__ for slot in base.__dict__.get('__slots__', ())
+                 if isinstance(getattr(cls, slot, None), MemberDescriptorType) and hasattr(self, slot)}
+        state.update(getattr(self, '__dict__', {}))
+        return state
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
 
     @property
     def name(self):
         return self.__class__.__name__
 
+    @property
+    def modified(self):
+        """bool: True if value was replaced since the element was constructed."""
+        return self.value is not getattr(self, '_parsed', None)
+
     @property
     def length(self):
         """bytes: Return the BER encoded byte length of self.value."""
@@ -63,7 +93,8 @@ class Element(metaclass=ABCMeta):
 
     def __bytes__(self):
         """Return the MISB encoded representation of a Key, Length, Value element."""
-        return bytes(self.key) + bytes(self.length) + bytes(self.value)
+        value = bytes(self.value)
+        return bytes(self.key) + ber_encode(len(value)) + value
 
     def __len__(self):
         """Return the byte length of self.value."""
@@ -80,6 +111,8 @@ class Element(metaclass=ABCMeta):
 
 
 class UnknownElement(Element):
+    __slots__ = ('key',)
+
     def __repr__(self):
         """Return as-code string used to re-create the object."""
         args = ', '.join(map(repr, (bytes(self.key), bytes(self.value))))
@@ -25,16 +25,21 @@
 
 from abc import ABCMeta
 from abc import abstractmethod
+from datetime import datetime
+from datetime import timezone
 from klvdata.element import Element
 from klvdata.common import bytes_to_datetime
 from klvdata.common import bytes_to_int
 from klvdata.common import bytes_to_float
 from klvdata.common import bytes_to_hexstr
 from klvdata.common import bytes_to_str
-from klvdata.common import datetime_to_bytes
+from klvdata.common import datetime_to_microseconds
 from klvdata.common import float_to_bytes
+from klvdata.common import int_to_bytes
 from klvdata.common import str_to_bytes
 from klvdata.common import ieee754_bytes_to_fp
+from klvdata.common import LinearMapping
+from klvdata.common import microseconds_to_datetime
                                            
 
 
@@ -49,10 +54,18 @@ class ElementParser(Element, metaclass=ABCMeta):
     can share. The parsing interfaces are cleaner and require less coding as
     their definitions (subclasses of Element Parser) do not need to call init
     on super with class key and instance value.
+
+    The key is a class attribute and only the value is stored per instance.
     """
+    __slots__ = ()
 
     def __init__(self, value):
-        super().__init__(self.key, value)
+        self.value = self._parsed = value
+
+    @property
+    def modified(self):
+        """bool: True if the value was replaced or changed since it was parsed."""
+        return self.value is not getattr(self, '_parsed', None) or getattr(self.value, 'modified', True)
 
     @property
     @classmethod
@@ -64,9 +77,55 @@ class ElementParser(Element, metaclass=ABCMeta):
         """Return as-code string used to re-create the object."""
         return '{}({})'.format(self.name, bytes(self.value))
 
+    @classmethod
+    def decoder(cls):
+        """Return function converting value bytes to the plain Python value of the element.
+
+        Used by SetParser.decode. Subclasses return a direct conversion, this
+        default goes through the element object.
+        """
+        def decode(value):
+            element_value = cls(value).value
+            return getattr(element_value, 'value', element_value)
+
+        return decode
+
+    @classmethod
+    def struct_field(cls, length):
+        """Return struct format character and converter for a value of length bytes, or None.
+
+        Used by SetParser.decode to unpack fixed width values of a packet
+        layout in one call. The converter takes the unpacked value and returns
+        the same result as the function returned by decoder.
+        """
+        return None
+
 
 class BaseValue(metaclass=ABCMeta):
-    """Abstract base class (superclass) used to insure internal interfaces are maintained."""
+    """Abstract base class (superclass) used to insure internal interfaces are maintained.
+
+    Values parsed from bytes keep them as their source. __bytes__ returns the
+    source until value is set, so unmodified values are emitted as parsed and
+    without encoding.
+
+    As for Element, the library's subclasses declare __slots__.
+    """
+    __slots__ = ('_source',)
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self._source = None
+
+    @property
+    def modified(self):
+        """bool: True if value was set since the value was parsed."""
+        return getattr(self, '_source', None) is None
+
     @abstractmethod
     def __bytes__(self):
         """Required by element.Element"""
@@ -79,15 +138,26 @@ class BaseValue(metaclass=ABCMeta):
 
 
 class BytesElementParser(ElementParser, metaclass=ABCMeta):
+    __slots__ = ()
+
     def __init__(self, value):
         super().__init__(BytesValue(value))
 
+    @classmethod
+    def decoder(cls):
+        return bytes
+
 
 class BytesValue(BaseValue):
+    __slots__ = ('_value',)
+
     def __init__(self, value):
-        self.value = value
+        self._value = value
+        self._source = _source(value)
 
     def __bytes__(self):
+        if self._source is not None:
+            return self._source
         return bytes(self.value)
 
     def __str__(self):
@@ -95,34 +165,90 @@ class BytesValue(BaseValue):
 
 
 class DateTimeElementParser(ElementParser, metaclass=ABCMeta):
+    __slots__ = ()
+
     def __init__(self, value):
         super().__init__(DateTimeValue(value))
 
+    @classmethod
+    def decoder(cls):
+        return bytes_to_datetime
+
+    @classmethod
+    def struct_field(cls, length):
+        if length == 8:
+            return 'Q', microseconds_to_datetime
+        return None
+
 
 class DateTimeValue(BaseValue):
+    """UTC time stamp held as integer microseconds.
+
+    The datetime is only built when value is accessed. Use microseconds to
+    compare or subtract time stamps without it.
+    """
+    __slots__ = ('_microseconds',)
+
+    # Microseconds of the last representable datetime.
+    max_microseconds = datetime_to_microseconds(datetime.max.replace(tzinfo=timezone.utc))
+
     def __init__(self, value):
-        self.value = bytes_to_datetime(value)
+        self._microseconds = bytes_to_int(value)
+        self._source = _source(value)
+
+        if self._microseconds > self.max_microseconds:
+            raise ValueError('time stamp out of range: {}'.format(self._microseconds))
+
+    @property
+    def microseconds(self):
+        return self._microseconds
+
+    @microseconds.setter
+    def microseconds(self, value):
+        self._microseconds = value
+        self._source = None
+
+    @property
+    def value(self):
+        return microseconds_to_datetime(self._microseconds)
+
+    @value.setter
+    def value(self, value):
+        self.microseconds = datetime_to_microseconds(value)
 
     def __bytes__(self):
-        return datetime_to_bytes(self.value)
+        if self._source is not None:
+            return self._source
+        return int_to_bytes(self._microseconds, 8)
 
     def __str__(self):
         return self.value.isoformat(sep=' ')
 
 
 class StringElementParser(ElementParser, metaclass=ABCMeta):
+    __slots__ = ()
+
     def __init__(self, value):
         super().__init__(StringValue(value))
 
+    @classmethod
+    def decoder(cls):
+        return bytes_to_str
+
 
 class StringValue(BaseValue):
+    __slots__ = ('_value',)
+
     def __init__(self, value):
         try:
-            self.value = bytes_to_str(value)
+            self._value = bytes_to_str(value)
         except TypeError:
-            self.value = value
+            self._value = value
+        self._source = _source(value)
 
     def __bytes__(self):
+        if self._source is not None:
+            return self._source
         return str_to_bytes(self.value)
 
     def __str__(self):
@@ -132,8 +258,41 @@ class StringValue(BaseValue):
 
 
 class MappedElementParser(ElementParser, metaclass=ABCMeta):
+    __slots__ = ()
+
     def __init__(self, value):
-        super().__init__(MappedValue(value, self._domain, self._range, self._error))
+        # Only use a mapping precomputed for this exact class, subclasses may
+        # redefine _domain, _range or _error.
+        super().__init__(MappedValue(value, type(self)))
+
+    @classmethod
+    def precompute(cls):
+        """Store a LinearMapping of the class _domain, _range and _error on the class.
+
+        Called when the class is registered with SetParser.add_parser. Classes
+        without a complete mapping definition are left without one.
+        """
+        try:
+            cls._mapping = LinearMapping(cls._domain, cls._range, cls._error)
+        except (TypeError, ValueError, ZeroDivisionError):
+            pass
+
+    @classmethod
+    def decoder(cls):
+        mapping = cls.__dict__.get('_mapping')
+
+        if mapping is not None:
+            return mapping.decode
+
+        return super().decoder()
+
+    @classmethod
+    def struct_field(cls, length):
+        mapping = cls.__dict__.get('_mapping')
+
+        if mapping is not None and mapping.format is not None and length == mapping.length:
+            return mapping.format, mapping.decode_int
+        return None
 
     @property
     @classmethod
@@ -154,17 +313,55 @@ class MappedElementParser(ElementParser, metaclass=ABCMeta):
         pass
 
 class MappedValue(BaseValue):
-    def __init__(self, value, _domain, _range, _error):
-        self._domain = _domain
-        self._range = _range
-        self._error = _error
+    """Floating point value mapped from fixed point bytes.
+
+    The mapping definition is not copied to the value. mapping is any object
+    with _domain, _range and _error attributes, typically the
+    MappedElementParser subclass, and is shared by all of its values.
+
+    The definition may also be given as MappedValue(value, _domain, _range, _error).
+    """
+    __slots__ = ('_value', 'mapping')
+
+    def __init__(self, value, mapping, *definition):
+        if definition:
+            mapping = MappingDefinition(mapping, *definition)
+
+        self.mapping = mapping
+        self._source = _source(value)
+
+        # Only use a LinearMapping precomputed for this exact class, subclasses
+        # may redefine _domain, _range or _error.
+        linear = getattr(mapping, '__dict__', {}).get('_mapping')
 
         try:
-            self.value = bytes_to_float(value, self._domain, self._range, self._error)
+            if linear is not None:
+                self._value = linear.decode(value)
+            else:
+                self._value = bytes_to_float(value, self._domain, self._range, self._error)
         except TypeError:
-            self.value = value
+            self._value = value
+
+    @property
+    def _domain(self):
+        return self.mapping._domain
+
+    @property
+    def _range(self):
+        return self.mapping._range
+
+    @property
+    def _error(self):
+        return self.mapping._error
 
     def __bytes__(self):
+        if self._source is not None:
+            return self._source
+
+        linear = getattr(self.mapping, '__dict__', {}).get('_mapping')
+
+        if linear is not None:
+            return linear.encode(self.value)
         return float_to_bytes(self.value, self._domain, self._range, self._error)
 
     def __str__(self):
@@ -175,19 +372,41 @@ class MappedValue(BaseValue):
     def __float__(self):
         return self.value
 
+
+class MappingDefinition(object):
+    """Mapping definition given as values instead of by a MappedElementParser subclass."""
+    __slots__ = ('_domain', '_range', '_error')
+
+    def __init__(self, _domain, _range, _error):
+        self._domain = _domain
+        self._range = _range
+        self._error = _error
+
+
 class IEEE754ElementParser(ElementParser, metaclass=ABCMeta):
+    __slots__ = ()
+
     def __init__(self, value):
         super().__init__(IEEE754Value(value))
 
+    @classmethod
+    def decoder(cls):
+        return ieee754_bytes_to_fp
+
 
 class IEEE754Value(BaseValue):
+    __slots__ = ('_value',)
+
     def __init__(self, value):
         try:
-            self.value = ieee754_bytes_to_fp(value)
+            self._value = ieee754_bytes_to_fp(value)
         except TypeError:
-            self.value = value
+            self._value = value
+        self._source = _source(value)
 
     def __bytes__(self):
+        if self._source is not None:
+            return self._source
         #TODO
         return ieee754_double_to_bytes(self.value)
 
@@ -195,4 +414,8 @@ class IEEE754Value(BaseValue):
         return bytes_to_hexstr(self.value, start='0x', sep='')
 
 
-
+def _source(value):
+    """Return value as bytes if it is encoded bytes, else None."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    return None
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import mmap
+from array import array
+from klvdata.packetindex import PacketIndex
+from klvdata.packetindex import frame_packets
+from klvdata.streamparser import StreamParser
+
+
+class KLVFile:
+    """Random access to the top level packets of a KLV recording.
+
+    The file is memory mapped and framed once on open to build a table of
+    packet offsets and lengths. Packets are parsed on access and are the
+    same objects StreamParser produces for the same bytes.
+
+    Supports len(), indexing, slicing, iteration and reverse iteration.
+
+    With sidecar set, the table is loaded from a PacketIndex stored next to
+    the recording when it is current, and written there otherwise.
+    """
+    def __init__(self, path, sidecar=False):
+        self.path = path
+
+        self._file = open(path, 'rb')
+        self._mmap = b''
+
+        try:
+            try:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                pass
+
+            if sidecar:
+                self.index = PacketIndex.open(path, self._mmap)
+                self.offsets, self.lengths = self.index.offsets, self.index.lengths
+            else:
+                self.index = None
+                self.offsets, self.lengths = self._scan()
+        except BaseException:
+            self.close()
+            raise
+
+    def _scan(self):
+        """Return arrays of packet offsets and packet lengths."""
+        offsets, lengths = array('Q'), array('Q')
+
+        key = value = None
+        for offset, length, key, value in frame_packets(self._mmap):
+            offsets.append(offset)
+            lengths.append(length)
+
+        # Release views on the map so that it can be closed.
+        del key, value
+
+        return offsets, lengths
+
+    def packet_bytes(self, index):
+        """Return the raw bytes of packet at index."""
+        offset = self.offsets[index]
+        return self._mmap[offset:offset + self.lengths[index]]
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return next(StreamParser(self.packet_bytes(index)))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reversed__(self):
+        for index in reversed(range(len(self))):
+            yield self[index]
+
+    def close(self):
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -23,50 +23,336 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from io import BytesIO
 from io import IOBase
+from io import SEEK_CUR
 from klvdata.common import bytes_to_int
 
+# Leading bytes shared by all SMPTE universal label keys.
+UNIVERSAL_LABEL_PREFIX = b'\x06\x0e\x2b\x34'
+
+
+def frame_length(buffer, offset, key_length):
+    """Return header length and value length of the triplet at offset in buffer.
+
+    Returns None if the buffer ends before the key and BER length are complete.
+    """
+    position = offset + key_length
+
+    if position >= len(buffer):
+        return None
+
+    byte_length = buffer[position]
+
+    if byte_length < 128:
+        # BER Short Form
+        return key_length + 1, byte_length
+
+    # BER Long Form
+    header = key_length + 1 + byte_length - 128
+
+    if offset + header > len(buffer):
+        return None
+
+    return header, bytes_to_int(buffer[position + 1:offset + header])
+
 
 class KLVParser(object):
-    """Return key, value pairs parsed from an SMPTE ST 336 source."""
-    def __init__(self, source, key_length):
-        if isinstance(source, IOBase):
-            self.source = source
-        else:
-            self.source = BytesIO(source)
+    """Return key, value pairs parsed from an SMPTE ST 336 source.
+
+    File-like sources are read in blocks of block_size bytes and key, length,
+    value triplets are framed out of an internal buffer. Partial triplets at
+    the end of a block are carried over and completed by the next block.
+
+    Sources supporting the buffer protocol (bytes, bytearray, mmap) are framed
+    directly. With zero_copy set, keys and values are returned as memoryview
+    slices of the source instead of bytes copies.
+
+    With sync set to a key prefix (e.g. UNIVERSAL_LABEL_PREFIX), the parser
+    recovers from corruption. A triplet is only accepted if its key starts
+    with sync, its length is at most max_length, its value is complete and it
+    is followed by sync or the end of the source. Otherwise the parser scans
+    forward to the next occurrence of sync. Each skipped span is recorded in
+    skipped as an (offset, length) tuple of source positions.
+
+    With keys set, only triplets whose key is in keys are returned. Values of
+    other triplets are stepped over without being copied, using seek() on
+    seekable sources.
 
+    Parsing begins offset bytes into the source, sliced off buffer sources
+    and skipped over on file-like sources. Positions are relative to offset.
+
+    triplet_offset is the source position of the last returned triplet, as
+    returned by tell() before it was framed.
+    """
+    def __init__(self, source, key_length, block_size=2**20, zero_copy=False, sync=None, max_length=2**20,
+                 keys=None, offset=0):
+        self.source = source
         self.key_length = key_length
+        self.block_size = block_size
+        self.zero_copy = zero_copy
+        self.sync = sync
+        self.max_length = max_length
+        self.keys = None if keys is None else frozenset(bytes(key) for key in keys)
+        self.skipped = []
+        self.triplet_offset = None
+
+        self._offset = 0
+        self._consumed = 0
+
+        if zero_copy:
+            self._buffer = memoryview(source).cast('B')
+            self._eof = True
+        elif isinstance(source, IOBase):
+            self._buffer = b''
+            self._eof = False
+        else:
+            self._buffer = bytes(source)
+            self._eof = True
+
+        if offset:
+            self.__discard(offset)
+            self._consumed -= offset
 
     def __iter__(self):
         return self
 
+    def tell(self):
+        """Return byte position of the next triplet relative to where parsing began."""
+        return self._consumed + self._offset
+
+    def framed(self):
+        """Return source bytes (key, length and value) of the last returned triplet.
+
+        Slices the internal buffer, so it is only valid until the next triplet
+        is framed.
+        """
+        return self._buffer[self.triplet_offset - self._consumed:self._offset]
+
     def __next__(self):
-        key = self.__read(self.key_length)
+        if self.sync is not None:
+            return self.__next_synced()
+
+        key_length, keys = self.key_length, self.keys
+
+        # Key, short form length and up to 8 bytes of long form length.
+        header_size = key_length + 9
+
+        while True:
+            if len(self._buffer) - self._offset < header_size and not self._eof:
+                self.__fill(header_size)
+
+            buffer, offset = self._buffer, self._offset
+            available = len(buffer)
+            position = offset + key_length
+
+            if position >= available:
+                # Too few bytes remain to hold a key and length.
+                self._offset = available
+                raise StopIteration
+
+            byte_length = buffer[position]
+
+            if byte_length < 128:
+                # BER Short Form
+                start, length = position + 1, byte_length
+            else:
+                # BER Long Form
+                start = position + 1 + byte_length - 128
+
+                if start > available:
+                    if not self._eof:
+                        self.__fill(start - offset)
+                        continue
+                    self._offset = available
+                    raise StopIteration
+
+                length = int.from_bytes(buffer[position + 1:start], byteorder='big')
+
+            if keys is not None and bytes(buffer[offset:position]) not in keys:
+                self._offset = start
+                self.__discard(length)
+                continue
+
+            end = start + length
+
+            if end > available:
+                if not self._eof:
+                    self.__fill(end - offset)
+                    continue
+
+                # Truncated values at the end of the source are returned as read.
+                if start >= available and length:
+                    self._offset = available
+                    raise StopIteration
+                end = available
+
+            self._offset = end
+            self.triplet_offset = self._consumed + offset
+
+            return buffer[offset:position], buffer[start:end]
 
-        byte_length = bytes_to_int(self.__read(1))
+    def __next_synced(self):
+        while True:
+            if not self.__ensure(self.key_length + 1):
+                # Too few bytes remain to hold a triplet.
+                self.__skip(len(self._buffer) - self._offset)
+                raise StopIteration
+
+            lengths = self.__frame()
+
+            if lengths is None:
+                self.__resync()
+                continue
+
+            header, end = lengths
+            start = self._offset
+            self._offset = start + end
+
+            key = self._buffer[start:start + self.key_length]
+
+            if self.keys is None or bytes(key) in self.keys:
+                self.triplet_offset = self._consumed + start
+                return key, self._buffer[start + header:start + end]
+
+    def __frame(self):
+        """Return header length and triplet length at the current offset if it passes the sync checks, else None."""
+        key_length, sync = self.key_length, self.sync
+
+        if self._buffer[self._offset:self._offset + len(sync)] != sync:
+            return None
+
+        byte_length = self._buffer[self._offset + key_length]
 
         if byte_length < 128:
             # BER Short Form
-            length = byte_length
+            header, length = key_length + 1, byte_length
         else:
             # BER Long Form
-            length = bytes_to_int(self.__read(byte_length - 128))
+            header = key_length + 1 + byte_length - 128
 
-        value = self.__read(length)
+            if not self.__ensure(header):
+                return None
 
-        return key, value
+            length = bytes_to_int(self._buffer[self._offset + key_length + 1:self._offset + header])
 
-    def __read(self, size):
-        if size == 0:
-            return b''
+        if length > self.max_length:
+            return None
 
-        assert size > 0
+        end = header + length
 
-        data = self.source.read(size)
+        # The next triplet must start with sync unless the source ends here.
+        if not self.__ensure(end + len(sync)):
+            if len(self._buffer) - self._offset < end:
+                return None
+        elif self._buffer[self._offset + end:self._offset + end + len(sync)] != sync:
+            return None
 
-        if data:
-            return data
-        else:
-            raise StopIteration
+        return header, end
+
+    def __resync(self):
+        """Advance past the current offset to the next occurrence of sync, recording the skipped span."""
+        start = self.tell()
+        self._offset += 1
+
+        while True:
+            index = self.__find(self.sync, self._offset)
+
+            if index >= 0:
+                self._offset = index
+                break
+
+            # Keep a tail that may hold the start of a sync split across blocks.
+            self._offset = max(self._offset, len(self._buffer) - len(self.sync) + 1)
+
+            if not self.__ensure(len(self._buffer) - self._offset + 1):
+                self._offset = len(self._buffer)
+                break
+
+        self.skipped.append((start, self.tell() - start))
+
+    def __skip(self, size):
+        if size > 0:
+            self.skipped.append((self.tell(), size))
+            self._offset += size
+
+    def __discard(self, size):
+        """Advance past size bytes without copying them, seeking the source where possible."""
+        available = len(self._buffer) - self._offset
+
+        if size <= available or self._eof:
+            self._offset += min(size, available)
+            return
+
+        remainder = size - available
+
+        self._consumed += len(self._buffer)
+        self._buffer = b''
+        self._offset = 0
+
+        if self.source.seekable():
+            self.source.seek(remainder, SEEK_CUR)
+            self._consumed += remainder
+            return
+
+        while remainder > 0:
+            chunk = self.source.read(min(self.block_size, remainder))
+
+            if not chunk:
+                self._eof = True
+                break
+
+            remainder -= len(chunk)
+            self._consumed += len(chunk)
+
+    def __find(self, sub, start):
+        buffer = self._buffer
+
+        if not isinstance(buffer, memoryview):
+            return buffer.find(sub, start)
+
+        # memoryview has no find, search the source (bytes, mmap) instead.
+        if hasattr(self.source, 'find'):
+            return self.source.find(sub, start)
+
+        # Otherwise search copies of one block at a time, overlapping by the
+        # length of sub so that matches across blocks are found.
+        while start < len(buffer):
+            stop = start + self.block_size
+            index = bytes(buffer[start:stop + len(sub) - 1]).find(sub)
+
+            if index >= 0:
+                return start + index
+
+            start = stop
+
+        return -1
+
+    def __ensure(self, size):
+        """Return True if size bytes are buffered past the current offset, reading from source if needed."""
+        if len(self._buffer) - self._offset < size and not self._eof:
+            self.__fill(size)
+
+        return len(self._buffer) - self._offset >= size
+
+    def __fill(self, size):
+        """Read blocks from source until size bytes are buffered or source is exhausted."""
+        # Prefer read1 so that pipes and sockets return what is available
+        # instead of blocking until a whole block has arrived.
+        read = getattr(self.source, 'read1', self.source.read)
+
+        chunks = [self._buffer[self._offset:]]
+        available = len(chunks[0])
+
+        while available < size:
+            chunk = read(max(self.block_size, size - available))
+
+            if not chunk:
+                self._eof = True
+                break
+
+            chunks.append(chunk)
+            available += len(chunk)
 
+        self._consumed += self._offset
+        self._buffer = b''.join(chunks)
+        self._offset = 0
@@ -69,7 +69,7 @@ _object_country_coding = {
 
 
 class UnknownElement(UnknownElement):
-    pass
+    __slots__ = ()
 
 
 @UASLocalMetadataSet.add_parser
@@ -82,6 +82,7 @@ class SecurityLocalMetadataSet(SetParser):
 
     Must be a subclass of Element or duck type Element.
     """
+    __slots__ = ()
     key, name = b'\x30', "Security Local Metadata Set"
     key_length = 1                  
     parsers = {}
@@ -97,6 +98,7 @@ class SecurityClassification(BytesElementParser):
     representing the entire security classification of the file in
     accordance with U.S. and NATO classification guidance.
     """
+    __slots__ = ()
     key = b'\x01'
 
     _classification = {
@@ -35,18 +35,22 @@ from klvdata.streamparser import StreamParser
 
 
 class UnknownElement(UnknownElement):
-    pass
+    __slots__ = ()
 
 
 @StreamParser.add_parser
 class UASLocalMetadataSet(SetParser):
     """MISB ST0601 UAS Local Metadata Set
     """
+    __slots__ = ()
     key = hexstr_to_bytes('06 0E 2B 34 - 02 0B 01 01 – 0E 01 03 01 - 01 00 00 00')
     name = 'UAS Datalink Local Set'
     key_length = 1
     parsers = {}
 
+    # The last item of the set is a checksum of the whole packet.
+    checksum_key = b'\x01'
+
     _unknown_element = UnknownElement
 
 
@@ -59,6 +63,7 @@ class Checksum(BytesElementParser):
 
     Initialized from bytes value as BytesValue.
     """
+    __slots__ = ()
     key = b'\x01'
     TAG = 1
     UDSKey = "-"
@@ -76,6 +81,7 @@ class PrecisionTimeStamp(DateTimeElementParser):
 
     See MISB ST 0601.11 for additional details.
     """
+    __slots__ = ()
     key = b'\x02'
     TAG = 2
     UDSKey = "06 0E 2B 34 01 01 01 03 07 02 01 01 01 05 00 00"
@@ -91,6 +97,7 @@ class MissionID(StringElementParser):
     Mission ID value field free text with maximum of 127 characters
     describing the event.
     """
+    __slots__ = ()
     key = b'\x03'
     TAG = 3
     UDSKey = "06 0E 2B 34 01 01 01 01 01 05 05 00 00 00 00 00"
@@ -102,6 +109,7 @@ class MissionID(StringElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformTailNumber(StringElementParser):
+    __slots__ = ()
     key = b'\x04'
     TAG = 4
     UDSKey = "-"
@@ -113,6 +121,7 @@ class PlatformTailNumber(StringElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformHeadingAngle(MappedElementParser):
+    __slots__ = ()
     key = b'\x05'
     TAG = 5
     UDSKey = "06 0E 2B 34 01 01 01 07 07 01 10 01 06 00 00 00"
@@ -126,6 +135,7 @@ class PlatformHeadingAngle(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformPitchAngle(MappedElementParser):
+    __slots__ = ()
     key = b'\x06'
     TAG = 6
     UDSKey = "06 0E 2B 34 01 01 01 07 07 01 10 01 05 00 00 00"
@@ -139,6 +149,7 @@ class PlatformPitchAngle(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformRollAngle(MappedElementParser):
+    __slots__ = ()
     key = b'\x07'
     TAG = 7
     UDSKey = " 06 0E 2B 34 01 01 01 07 07 01 10 01 04 00 00 00"
@@ -153,6 +164,7 @@ class PlatformRollAngle(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformTrueAirspeed(MappedElementParser):
+    __slots__ = ()
     key = b'\x08'
     TAG = 8
     UDSKey = "-"
@@ -167,6 +179,7 @@ class PlatformTrueAirspeed(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformIndicatedAirspeed(MappedElementParser):
+    __slots__ = ()
     key = b'\x09'
     TAG = 9
     UDSKey = "-"
@@ -181,6 +194,7 @@ class PlatformIndicatedAirspeed(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformDesignation(StringElementParser):
+    __slots__ = ()
     key = b'\x0A'
     TAG = 10
     UDSKey = "06 0E 2B 34 01 01 01 01 01 01 20 01 00 00 00 00"
@@ -192,6 +206,7 @@ class PlatformDesignation(StringElementParser):
 
 @UASLocalMetadataSet.add_parser
 class ImageSourceSensor(StringElementParser):
+    __slots__ = ()
     key = b'\x0B'
     TAG = 11
     UDSKey = "06 0E 2B 34 01 01 01 01 04 20 01 02 01 01 00 00"
@@ -203,6 +218,7 @@ class ImageSourceSensor(StringElementParser):
 
 @UASLocalMetadataSet.add_parser
 class ImageCoordinateSystem(StringElementParser):
+    __slots__ = ()
     key = b'\x0C'
     TAG = 12
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 01 01 00 00 00 00"
@@ -214,6 +230,7 @@ class ImageCoordinateSystem(StringElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorLatitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x0D'
     TAG = 13
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 02 04 02 00"
@@ -228,6 +245,7 @@ class SensorLatitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorLongitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x0E'
     TAG = 14
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 02 06 02 00"
@@ -242,6 +260,7 @@ class SensorLongitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorTrueAltitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x0F'
     TAG = 15
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 02 01 02 02 00 00"
@@ -256,6 +275,7 @@ class SensorTrueAltitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorHorizontalFieldOfView(MappedElementParser):
+    __slots__ = ()
     key = b'\x10'
     TAG = 16
     UDSKey = "06 0E 2B 34 01 01 01 02 04 20 02 01 01 08 00 00"
@@ -270,6 +290,7 @@ class SensorHorizontalFieldOfView(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorVerticalFieldOfView(MappedElementParser):
+    __slots__ = ()
     key = b'\x11'
     TAG = 17
     UDSKey = "-"
@@ -284,6 +305,7 @@ class SensorVerticalFieldOfView(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorRelativeAzimuthAngle(MappedElementParser):
+    __slots__ = ()
     key = b'\x12'
     TAG = 18
     UDSKey = "-"
@@ -298,6 +320,7 @@ class SensorRelativeAzimuthAngle(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorRelativeElevationAngle(MappedElementParser):
+    __slots__ = ()
     key = b'\x13'
     TAG = 19
     UDSKey = "-"
@@ -312,6 +335,7 @@ class SensorRelativeElevationAngle(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorRelativeRollAngle(MappedElementParser):
+    __slots__ = ()
     key = b'\x14'
     TAG = 20
     UDSKey = "-"
@@ -326,6 +350,7 @@ class SensorRelativeRollAngle(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SlantRange(MappedElementParser):
+    __slots__ = ()
     key = b'\x15'
     TAG = 21
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 08 01 01 00 00 00"
@@ -340,6 +365,7 @@ class SlantRange(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class TargetWidth(MappedElementParser):
+    __slots__ = ()
     key = b'\x16'
     TAG = 22
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 09 02 01 00 00 00"
@@ -354,6 +380,7 @@ class TargetWidth(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class FrameCenterLatitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x17'
     TAG = 23
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 02 01 03 02 00 00"
@@ -368,6 +395,7 @@ class FrameCenterLatitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class FrameCenterLongitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x18'
     TAG = 24
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 02 01 03 04 00 00"
@@ -382,6 +410,7 @@ class FrameCenterLongitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class FrameCenterElevation(MappedElementParser):
+    __slots__ = ()
     key = b'\x19'
     TAG = 25
     UDSKey = "-"
@@ -396,6 +425,7 @@ class FrameCenterElevation(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class OffsetCornerLatitudePoint1(MappedElementParser):
+    __slots__ = ()
     key = b'\x1A'
     TAG = 26
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 07 01 00"
@@ -410,6 +440,7 @@ class OffsetCornerLatitudePoint1(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class OffsetCornerLongitudePoint1(MappedElementParser):
+    __slots__ = ()
     key = b'\x1B'
     TAG = 27
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0B 01 00"
@@ -424,6 +455,7 @@ class OffsetCornerLongitudePoint1(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class OffsetCornerLatitudePoint2(MappedElementParser):
+    __slots__ = ()
     key = b'\x1C'
     TAG = 28
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 08 01 00"
@@ -438,6 +470,7 @@ class OffsetCornerLatitudePoint2(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class OffsetCornerLongitudePoint2(MappedElementParser):
+    __slots__ = ()
     key = b'\x1D'
     TAG = 29
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0C 01 00"
@@ -452,6 +485,7 @@ class OffsetCornerLongitudePoint2(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class OffsetCornerLatitudePoint3(MappedElementParser):
+    __slots__ = ()
     key = b'\x1E'
     TAG = 30
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 09 01 00"
@@ -466,6 +500,7 @@ class OffsetCornerLatitudePoint3(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class OffsetCornerLongitudePoint3(MappedElementParser):
+    __slots__ = ()
     key = b'\x1F'
     TAG = 31
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0D 01 00"
@@ -480,6 +515,7 @@ class OffsetCornerLongitudePoint3(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class OffsetCornerLatitudePoint4(MappedElementParser):
+    __slots__ = ()
     key = b'\x20'
     TAG = 32
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0A 01 00"
@@ -494,6 +530,7 @@ class OffsetCornerLatitudePoint4(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class OffsetCornerLongitudePoint4(MappedElementParser):
+    __slots__ = ()
     key = b'\x21'
     TAG = 33
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0E 01 00"
@@ -508,6 +545,7 @@ class OffsetCornerLongitudePoint4(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class IcingDetected(MappedElementParser):
+    __slots__ = ()
     key = b'\x22'
     TAG = 34
     UDSKey = ""
@@ -522,6 +560,7 @@ class IcingDetected(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class WindDirection(MappedElementParser):
+    __slots__ = ()
     key = b'\x23'
     TAG = 35
     UDSKey = "-"
@@ -536,6 +575,7 @@ class WindDirection(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class WindSpeed(MappedElementParser):
+    __slots__ = ()
     key = b'\x24'
     TAG = 36
     UDSKey = "-"
@@ -550,6 +590,7 @@ class WindSpeed(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class StaticPressure(MappedElementParser):
+    __slots__ = ()
     key = b'\x25'
     TAG = 37
     UDSKey = "-"
@@ -564,6 +605,7 @@ class StaticPressure(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class DensityAltitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x26'
     TAG = 38
     UDSKey = "-"
@@ -578,6 +620,7 @@ class DensityAltitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class OutsideAirTemperature(MappedElementParser):
+    __slots__ = ()
     key = b'\x27'
     TAG = 39
     UDSKey = "-"
@@ -592,6 +635,7 @@ class OutsideAirTemperature(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class TargetLocationLatitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x28'
     TAG = 40
     UDSKey = "-"
@@ -606,6 +650,7 @@ class TargetLocationLatitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class TargetLocationLongitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x29'
     TAG = 41
     UDSKey = "-"
@@ -620,6 +665,7 @@ class TargetLocationLongitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class TargetLocationElevation(MappedElementParser):
+    __slots__ = ()
     key = b'\x2A'
     TAG = 42
     UDSKey = "-"
@@ -634,6 +680,7 @@ class TargetLocationElevation(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class TargetTrackGateWidth(MappedElementParser):
+    __slots__ = ()
     key = b'\x2B'
     TAG = 43
     UDSKey = "-"
@@ -648,6 +695,7 @@ class TargetTrackGateWidth(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class TargetTrackGateHeight(MappedElementParser):
+    __slots__ = ()
     key = b'\x2C'
     TAG = 44
     UDSKey = "-"
@@ -662,6 +710,7 @@ class TargetTrackGateHeight(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class TargetErrorEstimateCE90(MappedElementParser):
+    __slots__ = ()
     key = b'\x2D'
     TAG = 45
     UDSKey = "-"
@@ -676,6 +725,7 @@ class TargetErrorEstimateCE90(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class TargetErrorEstimateLE90(MappedElementParser):
+    __slots__ = ()
     key = b'\x2E'
     TAG = 46
     UDSKey = "-"
@@ -690,6 +740,7 @@ class TargetErrorEstimateLE90(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class GenericFlagData01(MappedElementParser):
+    __slots__ = ()
     key = b'\x2F'
     TAG = 47
     UDSKey = "-"
@@ -713,6 +764,7 @@ class GenericFlagData01(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class DifferentialPressure(MappedElementParser):
+    __slots__ = ()
     key = b'\x31'
     TAG = 49
     UDSKey = "-"
@@ -727,6 +779,7 @@ class DifferentialPressure(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformAngleOfAttack(MappedElementParser):
+    __slots__ = ()
     key = b'\x32'
     TAG = 50
     UDSKey = "-"
@@ -741,6 +794,7 @@ class PlatformAngleOfAttack(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformVerticalSpeed(MappedElementParser):
+    __slots__ = ()
     key = b'\x33'
     TAG = 51
     UDSKey = "-"
@@ -755,6 +809,7 @@ class PlatformVerticalSpeed(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformSideslipAngle(MappedElementParser):
+    __slots__ = ()
     key = b'\x34'
     TAG = 52
     UDSKey = "-"
@@ -769,6 +824,7 @@ class PlatformSideslipAngle(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class AirfieldBarometricPressure(MappedElementParser):
+    __slots__ = ()
     key = b'\x35'
     TAG = 53
     UDSKey = "-"
@@ -783,6 +839,7 @@ class AirfieldBarometricPressure(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class AirfieldElevation(MappedElementParser):
+    __slots__ = ()
     key = b'\x36'
     TAG = 54
     UDSKey = "-"
@@ -797,6 +854,7 @@ class AirfieldElevation(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class RelativeHumidity(MappedElementParser):
+    __slots__ = ()
     key = b'\x37'
     TAG = 55
     UDSKey = "-"
@@ -811,6 +869,7 @@ class RelativeHumidity(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformGroundSpeed(MappedElementParser):
+    __slots__ = ()
     key = b'\x38'
     TAG = 56
     UDSKey = "-"
@@ -825,6 +884,7 @@ class PlatformGroundSpeed(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class GroundRange(MappedElementParser):
+    __slots__ = ()
     key = b'\x39'
     TAG = 57
     UDSKey = "-"
@@ -839,6 +899,7 @@ class GroundRange(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformFuelRemaining(MappedElementParser):
+    __slots__ = ()
     key = b'\x3A'
     TAG = 58
     UDSKey = "-"
@@ -853,6 +914,7 @@ class PlatformFuelRemaining(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformCallSign(StringElementParser):
+    __slots__ = ()
     key = b'\x3B'
     TAG = 59
     UDSKey = "-"
@@ -863,6 +925,7 @@ class PlatformCallSign(StringElementParser):
 
 @UASLocalMetadataSet.add_parser
 class WeaponLoad(MappedElementParser):
+    __slots__ = ()
     key = b'\x3C'
     TAG = 60
     UDSKey = "-"
@@ -875,6 +938,7 @@ class WeaponLoad(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class WeaponFired(MappedElementParser):
+    __slots__ = ()
     key = b'\x3D'
     TAG = 61
     UDSKey = "-"
@@ -888,6 +952,7 @@ class WeaponFired(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class LaserPRFCode(MappedElementParser):
+    __slots__ = ()
     key = b'\x3E'
     TAG = 62
     UDSKey = "-"
@@ -900,6 +965,7 @@ class LaserPRFCode(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorFieldOfViewName(MappedElementParser):
+    __slots__ = ()
     key = b'\x3F'
     TAG = 63
     UDSKey = "-"
@@ -912,6 +978,7 @@ class SensorFieldOfViewName(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformMagneticHeading(MappedElementParser):
+    __slots__ = ()
     key = b'\x40'
     TAG = 64
     UDSKey = "-"
@@ -926,6 +993,7 @@ class PlatformMagneticHeading(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class UASLSVersionNumber(MappedElementParser):
+    __slots__ = ()
     key = b'\x41'
     TAG = 65
     UDSKey = "-"
@@ -940,6 +1008,7 @@ class UASLSVersionNumber(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class AlternatePlatformLatitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x43'
     TAG = 67
     UDSKey = "-"
@@ -954,6 +1023,7 @@ class AlternatePlatformLatitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class AlternatePlatformLongitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x44'
     TAG = 68
     UDSKey = "-"
@@ -968,6 +1038,7 @@ class AlternatePlatformLongitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class AlternatePlatformAltitude(MappedElementParser):
+    __slots__ = ()
     key = b'\x45'
     TAG = 69
     UDSKey = "-"
@@ -982,6 +1053,7 @@ class AlternatePlatformAltitude(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class AlternatePlatformName(StringElementParser):
+    __slots__ = ()
     key = b'\x46'
     TAG = 70
     UDSKey = "-"
@@ -993,6 +1065,7 @@ class AlternatePlatformName(StringElementParser):
 
 @UASLocalMetadataSet.add_parser
 class AlternatePlatformHeading(MappedElementParser):
+    __slots__ = ()
     key = b'\x47'
     TAG = 71
     UDSKey = "-"
@@ -1007,6 +1080,7 @@ class AlternatePlatformHeading(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class EventStartTime(DateTimeElementParser):
+    __slots__ = ()
     key = b'\x48'
     TAG = 72
     UDSKey = "06 0E 2B 34 01 01 01 01 07 02 01 02 07 01 00 00"
@@ -1017,6 +1091,7 @@ class EventStartTime(DateTimeElementParser):
 
 @UASLocalMetadataSet.add_parser
 class RVTLocalSet(MappedElementParser):
+    __slots__ = ()
     key = b'\x49'
     TAG = 73
     UDSKey = "06 0E 2B 34 01 01 01 01 07 02 01 02 07 01 00 00"
@@ -1027,6 +1102,7 @@ class RVTLocalSet(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class VMTILocalSet(StringValue):
+    __slots__ = ()
     key = b'\x4A'
     TAG = 74
     UDSKey = "06 0E 2B 34 02 0B 01 01 0E 01 03 03 06 00 00 00"
@@ -1037,6 +1113,7 @@ class VMTILocalSet(StringValue):
 
 @UASLocalMetadataSet.add_parser
 class SensorEllipsoidHeightConversion(MappedElementParser):
+    __slots__ = ()
     key = b'\x4B'
     TAG = 75
     UDSKey = "-"
@@ -1051,6 +1128,7 @@ class SensorEllipsoidHeightConversion(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class AlternatePlatformEllipsoidHeight(MappedElementParser):
+    __slots__ = ()
     key = b'\x4C'
     TAG = 76
     UDSKey = "-"
@@ -1065,6 +1143,7 @@ class AlternatePlatformEllipsoidHeight(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class OperationalMode(StringElementParser):
+    __slots__ = ()
     key = b'\x4D'
     TAG = 77
     UDSKey = "-"
@@ -1075,6 +1154,7 @@ class OperationalMode(StringElementParser):
 
 @UASLocalMetadataSet.add_parser
 class FrameCenterHeightAboveEllipsoid(MappedElementParser):
+    __slots__ = ()
     key = b'\x4E'
     TAG = 78
     UDSKey = "-"
@@ -1089,6 +1169,7 @@ class FrameCenterHeightAboveEllipsoid(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorNorthVelocity(MappedElementParser):
+    __slots__ = ()
     key = b'\x4F'
     TAG = 79
     UDSKey = "-"
@@ -1103,6 +1184,7 @@ class SensorNorthVelocity(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorEastVelocity(MappedElementParser):
+    __slots__ = ()
     key = b'\x50'
     TAG = 80
     UDSKey = "-"
@@ -1126,6 +1208,7 @@ class SensorEastVelocity(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class CornerLatitudePoint1Full(MappedElementParser):
+    __slots__ = ()
     key = b'\x52'
     TAG = 82
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 07 01 00"
@@ -1140,6 +1223,7 @@ class CornerLatitudePoint1Full(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class CornerLongitudePoint1Full(MappedElementParser):
+    __slots__ = ()
     key = b'\x53'
     TAG = 83
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0B 01 00"
@@ -1154,6 +1238,7 @@ class CornerLongitudePoint1Full(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class CornerLatitudePoint2Full(MappedElementParser):
+    __slots__ = ()
     key = b'\x54'
     TAG = 84
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 08 01 00"
@@ -1168,6 +1253,7 @@ class CornerLatitudePoint2Full(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class CornerLongitudePoint2Full(MappedElementParser):
+    __slots__ = ()
     key = b'\x55'
     TAG = 85
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0C 01 00"
@@ -1182,6 +1268,7 @@ class CornerLongitudePoint2Full(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class CornerLatitudePoint3Full(MappedElementParser):
+    __slots__ = ()
     key = b'\x56'
     TAG = 86
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 09 01 00"
@@ -1196,6 +1283,7 @@ class CornerLatitudePoint3Full(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class CornerLongitudePoint3Full(MappedElementParser):
+    __slots__ = ()
     key = b'\x57'
     TAG = 87
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0D 01 00"
@@ -1210,6 +1298,7 @@ class CornerLongitudePoint3Full(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class CornerLatitudePoint4Full(MappedElementParser):
+    __slots__ = ()
     key = b'\x58'
     TAG = 88
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0A 01 00"
@@ -1224,6 +1313,7 @@ class CornerLatitudePoint4Full(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class CornerLongitudePoint4Full(MappedElementParser):
+    __slots__ = ()
     key = b'\x59'
     TAG = 89
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0E 01 00"
@@ -1238,6 +1328,7 @@ class CornerLongitudePoint4Full(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformPitchAngleFull(MappedElementParser):
+    __slots__ = ()
     key = b'\x5A'
     TAG = 90
     UDSKey = "06 0E 2B 34 01 01 01 07 07 01 10 01 05 00 00 00"
@@ -1252,6 +1343,7 @@ class PlatformPitchAngleFull(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformRollAngleFull(MappedElementParser):
+    __slots__ = ()
     key = b'\x5B'
     TAG = 91
     UDSKey = "06 0E 2B 34 01 01 01 07 07 01 10 01 04 00 00 00"
@@ -1266,6 +1358,7 @@ class PlatformRollAngleFull(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformAngleOfAttackFull(MappedElementParser):
+    __slots__ = ()
     key = b'\x5C'
     TAG = 92
     UDSKey = "-"
@@ -1280,6 +1373,7 @@ class PlatformAngleOfAttackFull(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class PlatformSideslipAngleFull(MappedElementParser):
+    __slots__ = ()
     key = b'\x5D'
     TAG = 93
     UDSKey = "-"
@@ -1314,6 +1408,7 @@ class PlatformSideslipAngleFull(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class TargetWidthExtended(MappedElementParser):
+    __slots__ = ()
     key = b'\x60'
     TAG = 96
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 09 02 01 00 00 00"
@@ -1328,6 +1423,7 @@ class TargetWidthExtended(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class DensityAltitudeExtended(MappedElementParser):
+    __slots__ = ()
     key = b'\x67'
     TAG = 103
     UDSKey = "06 0E 2B 34 01 01 01 01 0E 01 01 01 10 00 00 00"
@@ -1341,6 +1437,7 @@ class DensityAltitudeExtended(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class SensorEllipsoidHeightExtended(MappedElementParser):
+    __slots__ = ()
     key = b'\x68'
     TAG = 104
     UDSKey = "06 0E 2B 34 01 01 01 01 0E 01 02 01 82 47 00 00"
@@ -1355,6 +1452,7 @@ class SensorEllipsoidHeightExtended(MappedElementParser):
 
 @UASLocalMetadataSet.add_parser
 class AlternatePlatformEllipsoidHeightExtended(MappedElementParser):
+    __slots__ = ()
     key = b'\x69'
     TAG = 105
     UDSKey = "06 0E 2B 34 01 01 01 01 0E 01 02 01 82 48 00 00"
@@ -36,7 +36,7 @@ from klvdata.streamparser import StreamParser
 
 
 class UnknownElement(UnknownElement):
-    pass
+    __slots__ = ()
 
 
 @StreamParser.add_parser
@@ -44,6 +44,7 @@ class UAVBasicUniversalMetadataSet(SetParser):
     """MISB EG0104.4 Predator UAV Basic Universal Metadata Set
     http://www.gwg.nga.mil/misb/docs/eg/EG0104.4.pdf
     """
+    __slots__ = ()
 
     #key = hexstr_to_bytes('06 0E 2B 34 - 01 01 01 01 – 02 01 03 00 - 00 00 00 00')
     key = hexstr_to_bytes('06 0E 2B 34 - 02 01 01 01 – 0E 01 01 02 - 01 01 00 00')
@@ -63,6 +64,7 @@ class PrecisionTimeStamp(DateTimeElementParser):
 
     See MISB ST 0601.11 for additional details.
     """
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 02 01 01 01 05 00 00")
     TAG = 2
     UDSKey = "06 0E 2B 34 01 01 01 03 07 02 01 01 01 05 00 00"
@@ -78,6 +80,7 @@ class MissionID(StringElementParser):
     Mission ID value field free text with maximum of 127 characters
     describing the event.
     """
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 01 05 05 00 00 00 00 00")
     TAG = 3
     UDSKey = "06 0E 2B 34 01 01 01 01 01 05 05 00 00 00 00 00"
@@ -89,6 +92,7 @@ class MissionID(StringElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class PlatformHeadingAngle(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 07 07 01 10 01 06 00 00 00")
     TAG = 5
     UDSKey = "06 0E 2B 34 01 01 01 07 07 01 10 01 06 00 00 00"
@@ -101,6 +105,7 @@ class PlatformHeadingAngle(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class PlatformPitchAngle(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 07 07 01 10 01 05 00 00 00")
     TAG = 6
     UDSKey = "06 0E 2B 34 01 01 01 07 07 01 10 01 05 00 00 00"
@@ -113,6 +118,7 @@ class PlatformPitchAngle(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class PlatformRollAngle(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 07 07 01 10 01 04 00 00 00")
     TAG = 7
     UDSKey = "06 0E 2B 34 01 01 01 07 07 01 10 01 04 00 00 00"
@@ -125,6 +131,7 @@ class PlatformRollAngle(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class PlatformDesignation(StringElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 01 01 20 01 00 00 00 00")
     TAG = 10
     UDSKey = "06 0E 2B 34 01 01 01 01 01 01 20 01 00 00 00 00"
@@ -136,6 +143,7 @@ class PlatformDesignation(StringElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class ImageSourceSensor(StringElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 04 20 01 02 01 01 00 00")
     TAG = 11
     UDSKey = "06 0E 2B 34 01 01 01 01 04 20 01 02 01 01 00 00"
@@ -147,6 +155,7 @@ class ImageSourceSensor(StringElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class ImageCoordinateSystem(StringElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 01 01 00 00 00 00")
     TAG = 12
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 01 01 00 00 00 00"
@@ -157,6 +166,7 @@ class ImageCoordinateSystem(StringElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class SensorLatitude(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 02 01 02 04 00 00")
     TAG = 13
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 02 01 02 04 00 00"
@@ -170,6 +180,7 @@ class SensorLatitude(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class SensorLatitude1(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 02 01 02 04 02 00")
     TAG = 13
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 02 01 02 04 02 00"
@@ -183,6 +194,7 @@ class SensorLatitude1(IEEE754ElementParser):
 #the key is wrong, comes from 1.klv
 @UAVBasicUniversalMetadataSet.add_parser
 class SensorLatitude2(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 01 01 01 03 07 01 02 01 02 04 02 00")
     TAG = 13
     UDSKey = "06 0E 01 01 01 03 07 01 02 01 02 04 02 00"
@@ -195,6 +207,7 @@ class SensorLatitude2(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class SensorLongitude(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 02 01 02 06 00 00")
     TAG = 14
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 02 01 02 06 00 00"
@@ -207,6 +220,7 @@ class SensorLongitude(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class SensorLongitude1(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 02 01 02 06 02 00")
     TAG = 14
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 02 01 02 06 02 00"
@@ -219,6 +233,7 @@ class SensorLongitude1(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class SensorTrueAltitude(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 02 01 02 02 00 00")
     TAG = 15
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 02 01 02 02 00 00"
@@ -232,6 +247,7 @@ class SensorTrueAltitude(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class SensorHorizontalFieldOfView(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 02 04 20 02 01 01 08 00 00")
     TAG = 16
     UDSKey = "06 0E 2B 34 01 01 01 02 04 20 02 01 01 08 00 00"
@@ -244,6 +260,7 @@ class SensorHorizontalFieldOfView(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class SensorVerticalFieldOfView(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0e 2b 34 01 01 01 07 04 20 02 01 01 0a 01 00")
     TAG = 17
     UDSKey = "06 0e 2b 34 01 01 01 07 04 20 02 01 01 0a 01 00"
@@ -256,6 +273,7 @@ class SensorVerticalFieldOfView(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class SensorRelativeAzimuthAngle(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0e 2b 34 01 01 01 01 07 01 10 01 02 00 00 00")
     TAG = 18
     UDSKey = "06 0e 2b 34 01 01 01 01 07 01 10 01 02 00 00 00"
@@ -268,6 +286,7 @@ class SensorRelativeAzimuthAngle(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser 
 class SensorRelativeElevationAngle(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0e 2b 34 01 01 01 01 07 01 10 01 03 00 00 00")
     TAG = 19
     UDSKey = "06 0e 2b 34 01 01 01 01 07 01 10 01 03 00 00 00"
@@ -280,6 +299,7 @@ class SensorRelativeElevationAngle(IEEE754ElementParser):
     
 @UAVBasicUniversalMetadataSet.add_parser                                        
 class SlantRange(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 08 01 01 00 00 00")
     TAG = 21
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 08 01 01 00 00 00"
@@ -293,6 +313,7 @@ class SlantRange(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class TargetWidth(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 09 02 01 00 00 00")
     TAG = 22
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 09 02 01 00 00 00"
@@ -306,6 +327,7 @@ class TargetWidth(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class FrameCenterLatitude(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 02 01 03 02 00 00")
     TAG = 23
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 02 01 03 02 00 00"
@@ -319,6 +341,7 @@ class FrameCenterLatitude(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class FrameCenterLongitude(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 02 01 03 04 00 00")
     TAG = 24
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 02 01 03 04 00 00"
@@ -332,6 +355,7 @@ class FrameCenterLongitude(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class OffsetCornerLatitudePoint1(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 07 01 00")
     TAG = 26
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 07 01 00"
@@ -345,6 +369,7 @@ class OffsetCornerLatitudePoint1(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class OffsetCornerLongitudePoint1(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 0B 01 00")
     TAG = 27
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0B 01 00"
@@ -358,6 +383,7 @@ class OffsetCornerLongitudePoint1(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class OffsetCornerLatitudePoint2(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 08 01 00")
     TAG = 28
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 08 01 00"
@@ -371,6 +397,7 @@ class OffsetCornerLatitudePoint2(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class OffsetCornerLongitudePoint2(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 0C 01 00")
     TAG = 29
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0C 01 00"
@@ -384,6 +411,7 @@ class OffsetCornerLongitudePoint2(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class OffsetCornerLatitudePoint3(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 09 01 00")
     TAG = 30
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 09 01 00"
@@ -397,6 +425,7 @@ class OffsetCornerLatitudePoint3(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class OffsetCornerLongitudePoint3(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 0D 01 00")
     TAG = 31
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0D 01 00"
@@ -410,6 +439,7 @@ class OffsetCornerLongitudePoint3(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class OffsetCornerLatitudePoint4(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 0A 01 00")
     TAG = 32
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0A 01 00"
@@ -423,6 +453,7 @@ class OffsetCornerLatitudePoint4(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class OffsetCornerLongitudePoint4(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 0E 01 00")
     TAG = 33
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0E 01 00"
@@ -436,6 +467,7 @@ class OffsetCornerLongitudePoint4(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class StartDateTime(StringElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 02 01 02 01 01 00 00")
     TAG = 72
     UDSKey = "06 0E 2B 34 01 01 01 01 07 02 01 02 01 01 00 00"
@@ -445,6 +477,7 @@ class StartDateTime(StringElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class EventStartTime(DateTimeElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 02 01 02 07 01 00 00")
     TAG = 72
     UDSKey = "06 0E 2B 34 01 01 01 01 07 02 01 02 07 01 00 00"
@@ -454,6 +487,7 @@ class EventStartTime(DateTimeElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class RVTLocalSet(StringElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 02 01 02 07 01 00 00")
     TAG = 73
     UDSKey = "06 0E 2B 34 01 01 01 01 07 02 01 02 07 01 00 00"
@@ -464,6 +498,7 @@ class RVTLocalSet(StringElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class VMTILocalSet(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 02 0B 01 01 0E 01 03 03 06 00 00 00")
     TAG = 74
     UDSKey = "06 0E 2B 34 02 0B 01 01 0E 01 03 03 06 00 00 00"
@@ -474,6 +509,7 @@ class VMTILocalSet(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class CornerLatitudePoint1Full(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 07 01 00")
     TAG = 82
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 07 01 00"
@@ -487,6 +523,7 @@ class CornerLatitudePoint1Full(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class CornerLongitudePoint1Full(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 0B 01 00")
     TAG = 83
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0B 01 00"
@@ -500,6 +537,7 @@ class CornerLongitudePoint1Full(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class CornerLatitudePoint2Full(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 08 01 00")
     TAG = 84
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 08 01 00"
@@ -513,6 +551,7 @@ class CornerLatitudePoint2Full(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class CornerLongitudePoint2Full(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 0C 01 00")
     TAG = 85
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0C 01 00"
@@ -526,6 +565,7 @@ class CornerLongitudePoint2Full(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class CornerLatitudePoint3Full(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 09 01 00")
     TAG = 86
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 09 01 00"
@@ -539,6 +579,7 @@ class CornerLatitudePoint3Full(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class CornerLongitudePoint3Full(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 0D 01 00")
     TAG = 87
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0D 01 00"
@@ -552,6 +593,7 @@ class CornerLongitudePoint3Full(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class CornerLatitudePoint4Full(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 0A 01 00")
     TAG = 88
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0A 01 00"
@@ -565,6 +607,7 @@ class CornerLatitudePoint4Full(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class CornerLongitudePoint4Full(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 03 07 01 02 01 03 0E 01 00")
     TAG = 89
     UDSKey = "06 0E 2B 34 01 01 01 03 07 01 02 01 03 0E 01 00"
@@ -578,6 +621,7 @@ class CornerLongitudePoint4Full(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class PlatformPitchAngleFull(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 07 07 01 10 01 05 00 00 00")
     TAG = 90
     UDSKey = "06 0E 2B 34 01 01 01 07 07 01 10 01 05 00 00 00"
@@ -591,6 +635,7 @@ class PlatformPitchAngleFull(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class PlatformRollAngleFull(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 07 07 01 10 01 04 00 00 00")
     TAG = 91
     UDSKey = "06 0E 2B 34 01 01 01 07 07 01 10 01 04 00 00 00"
@@ -604,6 +649,7 @@ class PlatformRollAngleFull(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class MIISCoreIdentifier(StringElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 0E 01 04 05 03 00 00 00")
     TAG = 94
     UDSKey = "06 0E 2B 34 01 01 01 01 0E 01 04 05 03 00 00 00"
@@ -614,6 +660,7 @@ class MIISCoreIdentifier(StringElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class SARMotionImageryLocalSet(StringElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 02 0B 01 01 0E 01 03 03 0D 00 00 00")
     TAG = 95
     UDSKey = "06 0E 2B 34 02 0B 01 01 0E 01 03 03 0D 00 00 00"
@@ -624,6 +671,7 @@ class SARMotionImageryLocalSet(StringElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class TargetWidthExtended(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 07 01 09 02 01 00 00 00")
     TAG = 96
     UDSKey = "06 0E 2B 34 01 01 01 01 07 01 09 02 01 00 00 00"
@@ -637,6 +685,7 @@ class TargetWidthExtended(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class DensityAltitudeExtended(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 0E 01 01 01 10 00 00 00")
     TAG = 103
     UDSKey = "06 0E 2B 34 01 01 01 01 0E 01 01 01 10 00 00 00"
@@ -649,6 +698,7 @@ class DensityAltitudeExtended(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class SensorEllipsoidHeightExtended(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 0E 01 02 01 82 47 00 00")
     TAG = 104
     UDSKey = "06 0E 2B 34 01 01 01 01 0E 01 02 01 82 47 00 00"
@@ -662,6 +712,7 @@ class SensorEllipsoidHeightExtended(IEEE754ElementParser):
 
 @UAVBasicUniversalMetadataSet.add_parser
 class AlternatePlatformEllipsoidHeightExtended(IEEE754ElementParser):
+    __slots__ = ()
     key = hexstr_to_bytes("06 0E 2B 34 01 01 01 01 0E 01 02 01 82 48 00 00")
     TAG = 105
     UDSKey = "06 0E 2B 34 01 01 01 01 0E 01 02 01 82 48 00 00"
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from datetime import datetime
+from io import IOBase
+from struct import Struct
+from klvdata.common import ber_encode
+from klvdata.common import datetime_to_microseconds
+from klvdata.common import is_subclass
+from klvdata.common import packet_checksum
+from klvdata.common import str_to_bytes
+from klvdata.elementparser import DateTimeElementParser
+from klvdata.elementparser import StringElementParser
+from klvdata.klvparser import KLVParser
+from klvdata.klvparser import frame_length
+from klvdata.misb0601 import UASLocalMetadataSet
+
+
+class UASPacketBuilder(object):
+    """Encoder of UAS Local Set packets from engineering values.
+
+    build takes a dictionary of tag number to value and returns the packet
+    bytes, items in the given order followed by the checksum (tag 1). Values
+    are converted by tag:
+
+        Mapped elements     float, or None for the error value
+        Time stamps         datetime or integer microseconds
+        Strings             str
+        Other tags          bytes of the encoded value
+
+    The conversion and struct of each tag are prepared once and reused. Each
+    packet is packed into a single preallocated bytearray and its checksum is
+    computed over it.
+
+    rewrite replaces or removes tags of existing packets, converting new
+    values the same way, and rewrite_stream applies it to every packet of a
+    stream.
+    """
+    set_parser = UASLocalMetadataSet
+
+    def __init__(self):
+        self._encoders = {}
+
+    def build(self, values):
+        """Return bytes of the packet holding values, a dictionary of tag number to value."""
+        items = []
+        size = 4
+
+        for tag, value in values.items():
+            fixed, header, convert = self._encoders.get(tag) or self._compile(tag)
+
+            if fixed is not None:
+                items.append((fixed, header, convert(value)))
+                size += fixed.size
+            else:
+                data = convert(value)
+                header = bytes([tag]) + ber_encode(len(data))
+                items.append((None, header, data))
+                size += len(header) + len(data)
+
+        key = self.set_parser.key
+        length = ber_encode(size)
+
+        packet = bytearray(len(key) + len(length) + size)
+        offset = len(key) + len(length)
+        packet[:offset] = key + length
+
+        for fixed, header, data in items:
+            if fixed is not None:
+                fixed.pack_into(packet, offset, header, data)
+                offset += fixed.size
+            else:
+                end = offset + len(header)
+                packet[offset:end] = header
+                offset = end + len(data)
+                packet[end:offset] = data
+
+        packet[offset:offset + 2] = self.set_parser.checksum_key + b'\x02'
+        packet[offset + 2:] = packet_checksum(packet)
+
+        return bytes(packet)
+
+    def rewrite(self, packet, values):
+        """Return bytes of packet with tags replaced by values, a dictionary of tag number to value.
+
+        Tags set to None are removed. Other items are copied as they are,
+        without being parsed, and tags not found in packet are added before
+        the checksum. The set length and checksum are recomputed.
+        """
+        view = memoryview(packet).cast('B')
+        key = self.set_parser.key
+
+        lengths = frame_length(view, 0, len(key))
+
+        if view[:len(key)] != key or lengths is None:
+            raise ValueError('not a {} packet'.format(self.set_parser.name))
+
+        header, length = lengths
+
+        if header + length > len(view):
+            raise ValueError('packet truncated')
+
+        return self._rewrite(view[header:header + length], values)
+
+    def rewrite_stream(self, source, destination, values):
+        """Write packets of source to destination, UAS Local Sets rewritten with values.
+
+        source is a file-like object or a buffer, destination a writable
+        file-like object. Other packets are copied unchanged. Returns the
+        number of packets rewritten.
+        """
+        key = self.set_parser.key
+        count = 0
+
+        zero_copy = not isinstance(source, IOBase)
+        parser = KLVParser(source, len(key), zero_copy=zero_copy)
+
+        for packet_key, value in parser:
+            if packet_key == key:
+                destination.write(self._rewrite(value, values))
+                count += 1
+            else:
+                # As framed, keeping the length encoding and any truncation.
+                destination.write(parser.framed())
+
+        return count
+
+    def _rewrite(self, value, values):
+        """Return packet bytes of set value with tags replaced by values."""
+        checksum_key = self.set_parser.checksum_key
+
+        replace = {bytes([tag]): new for tag, new in values.items()}
+
+        if checksum_key in replace:
+            raise ValueError('checksum is computed by the builder')
+
+        # New values not yet written, in the order given.
+        pending = {item_key: new for item_key, new in replace.items() if new is not None}
+
+        pieces = []
+        offset = span = 0
+
+        while offset < len(value):
+            lengths = frame_length(value, offset, 1)
+            end = None if lengths is None else offset + lengths[0] + lengths[1]
+
+            if end is None or end > len(value):
+                raise ValueError('item truncated at offset {}'.format(offset))
+
+            item_key = bytes(value[offset:offset + 1])
+
+            # Unchanged runs of items are copied as single slices.
+            if item_key in replace or item_key == checksum_key:
+                pieces.append(value[span:offset])
+                if item_key in pending:
+                    pieces.append(self._encode(item_key[0], pending.pop(item_key)))
+                span = end
+
+            offset = end
+
+        pieces.append(value[span:offset])
+        pieces.extend(self._encode(item_key[0], new) for item_key, new in pending.items())
+
+        size = sum(len(piece) for piece in pieces) + 4
+
+        packet = bytearray(self.set_parser.key)
+        packet += ber_encode(size)
+        for piece in pieces:
+            packet += piece
+        packet += checksum_key + b'\x02\x00\x00'
+        packet[-2:] = packet_checksum(packet)
+
+        return bytes(packet)
+
+    def _encode(self, tag, value):
+        """Return bytes of the item of tag holding value."""
+        fixed, header, convert = self._encoders.get(tag) or self._compile(tag)
+
+        if fixed is not None:
+            return fixed.pack(header, convert(value))
+
+        data = convert(value)
+        return bytes([tag]) + ber_encode(len(data)) + data
+
+    def _compile(self, tag):
+        """Return and store (struct, header, converter) of a tag.
+
+        Fixed width tags pack their constant tag and length header and the
+        converted value with struct. Others have no struct and their
+        converter returns the value bytes.
+        """
+        key = bytes([tag])
+
+        if key == self.set_parser.checksum_key:
+            raise ValueError('checksum is computed by the builder')
+
+        parser = self.set_parser.parsers.get(key)
+        mapping = getattr(parser, '__dict__', {}).get('_mapping')
+
+        if mapping is not None and mapping.format is not None:
+            encoder = Struct('>2s' + mapping.format), key + bytes([mapping.length]), mapping.encode_int
+        elif is_subclass(parser, DateTimeElementParser):
+            encoder = Struct('>2sQ'), key + b'\x08', _microseconds
+        elif is_subclass(parser, StringElementParser):
+            encoder = None, None, str_to_bytes
+        elif mapping is not None:
+            encoder = None, None, mapping.encode
+        else:
+            encoder = None, None, bytes
+
+        self._encoders[tag] = encoder
+
+        return encoder
+
+
+def _microseconds(value):
+    if isinstance(value, datetime):
+        return datetime_to_microseconds(value)
+    return value
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import sys
+from array import array
+from struct import Struct
+from klvdata.common import bytes_to_int
+from klvdata.klvparser import KLVParser
+from klvdata.misb0601 import UASLocalMetadataSet
+
+# Sidecar layout: one header followed by one column per field, little endian.
+# Header is magic, version, source file size, source mtime (ns) and packet count.
+# Columns are packet offsets, packet lengths and Precision Time Stamps of 8
+# bytes each, then 16 byte set keys.
+_header = Struct('<4sIQqQ')
+_columns = (('offsets', 'Q'), ('lengths', 'Q'), ('timestamps', 'q'))
+_key_size = 16
+
+MAGIC = b'KLVI'
+VERSION = 2
+SUFFIX = '.klvidx'
+
+# Precision Time Stamp recorded for packets without tag 2.
+NO_TIMESTAMP = -1
+
+
+def sidecar_path(path):
+    """Return path of the sidecar index for recording at path."""
+    return path + SUFFIX
+
+
+class PacketIndex:
+    """Table of top level packet offset, length, set key and Precision Time Stamp.
+
+    Built with a single framing pass over a recording and persisted next to it
+    as a sidecar of columns, so that reopening a recording loads the table
+    with one read and a copy per column instead of framing the whole file
+    again. A sidecar is only used while the recording's size and modification
+    time match.
+
+    offsets, lengths and timestamps are arrays. keys holds the 16 byte set
+    keys back to back, see key.
+    """
+    def __init__(self, offsets, lengths, keys, timestamps, size, mtime):
+        self.offsets = offsets
+        self.lengths = lengths
+        self.keys = keys
+        self.timestamps = timestamps
+        self.size = size
+        self.mtime = mtime
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def key(self, position):
+        """Return set key of packet at position, padded to 16 bytes."""
+        start = position * _key_size
+        return bytes(self.keys[start:start + _key_size])
+
+    @classmethod
+    def build(cls, buffer, size, mtime):
+        """Return index framed from buffer holding the recording."""
+        offsets, lengths, timestamps = array('Q'), array('Q'), array('q')
+        keys = bytearray()
+
+        for offset, length, key, value in frame_packets(buffer):
+            offsets.append(offset)
+            lengths.append(length)
+            keys += bytes(key).ljust(_key_size, b'\x00')
+            timestamps.append(_precision_time_stamp(key, value))
+
+        return cls(offsets, lengths, keys, timestamps, size, mtime)
+
+    @classmethod
+    def load(cls, path):
+        """Return index read from sidecar at path.
+
+        Raises ValueError if the sidecar is malformed.
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        if len(data) < _header.size:
+            raise ValueError('truncated index header')
+
+        magic, version, size, mtime, count = _header.unpack_from(data)
+
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('not a version {} packet index'.format(VERSION))
+
+        if len(data) != _header.size + count * (8 * len(_columns) + _key_size):
+            raise ValueError('index packet count does not match length')
+
+        view = memoryview(data)
+        position = _header.size
+        columns = {}
+
+        for name, typecode in _columns:
+            column = array(typecode)
+            column.frombytes(view[position:position + 8 * count])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            columns[name] = column
+            position += 8 * count
+
+        keys = bytes(view[position:])
+
+        return cls(columns['offsets'], columns['lengths'], keys, columns['timestamps'], size, mtime)
+
+    def save(self, path):
+        """Write index as sidecar at path."""
+        with open(path, 'wb') as f:
+            f.write(_header.pack(MAGIC, VERSION, self.size, self.mtime, len(self)))
+
+            for name, typecode in _columns:
+                column = getattr(self, name)
+                if sys.byteorder == 'big':
+                    column = array(typecode, column)
+                    column.byteswap()
+                f.write(column)
+
+            f.write(self.keys)
+
+    @classmethod
+    def open(cls, path, buffer):
+        """Return index for recording at path, loading its sidecar when current.
+
+        If the sidecar is missing, malformed or stale, the index is built from
+        buffer and the sidecar is rewritten where the directory is writable.
+        """
+        stat = os.stat(path)
+        index_path = sidecar_path(path)
+
+        try:
+            index = cls.load(index_path)
+        except (OSError, ValueError):
+            pass
+        else:
+            if (index.size, index.mtime) == (stat.st_size, stat.st_mtime_ns):
+                return index
+
+        index = cls.build(buffer, stat.st_size, stat.st_mtime_ns)
+
+        try:
+            index.save(index_path)
+        except OSError:
+            pass
+
+        return index
+
+
+def frame_packets(buffer):
+    """Yield offset, length, key and value of each top level packet of buffer.
+
+    Keys and values are memoryview slices of buffer. Callers holding on to
+    the last of them must release them before closing a map.
+    """
+    # All keys in parser are expected to be 16 bytes long.
+    parser = KLVParser(buffer, key_length=16, zero_copy=True)
+
+    start = parser.tell()
+    for key, value in parser:
+        end = parser.tell()
+        yield start, end - start, key, value
+        start = end
+
+
+def _precision_time_stamp(key, value):
+    """Return Precision Time Stamp in microseconds from a framed UAS Local Set."""
+    if key != UASLocalMetadataSet.key:
+        return NO_TIMESTAMP
+
+    for tag, data in KLVParser(value, key_length=1, zero_copy=True):
+        # Tag 2 is normally the first item of the set, so the scan rarely goes further.
+        if tag == b'\x02':
+            if len(data) == 8 and data[0] < 0x80:
+                return bytes_to_int(data)
+            break
+
+    return NO_TIMESTAMP
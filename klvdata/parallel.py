@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from klvdata.klvparser import KLVParser
+from klvdata.klvparser import UNIVERSAL_LABEL_PREFIX
+from klvdata.streamparser import StreamParser
+
+
+def parse_file(path, max_workers=None, range_size=2**26):
+    """Return list of packets parsed from the recording at path using a pool of processes.
+
+    The file is split into byte ranges of range_size bytes. Each range is
+    parsed in a worker process, starting at the first universal label prefix
+    in the range and covering every packet that starts inside it. Packets are
+    parsed by StreamParser and merged in file order.
+
+    A range whose first packet does not start where the previous range's
+    last packet ended (a false prefix match inside a value, or corruption
+    across the boundary) is parsed again from the correct offset in this
+    process, so the result matches a serial resynchronising parse.
+    """
+    size = os.path.getsize(path)
+
+    starts = range(0, size, range_size)
+    stops = [min(start + range_size, size) for start in starts]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_parse_range, repeat(path), starts, stops))
+
+    packets = []
+    expected = None
+
+    for (first, stopped, items), stop in zip(results, stops):
+        if first is None or (expected is not None and expected >= stop):
+            continue
+
+        if expected is not None and first != expected:
+            first, stopped, items = _parse_range(path, expected, stop)
+
+        packets.extend(items)
+        expected = stopped
+
+    return packets
+
+
+def _parse_range(path, start, stop):
+    """Return offset of the first packet, offset following the last packet and packets starting in [start, stop)."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        first = buffer.find(UNIVERSAL_LABEL_PREFIX, start, stop)
+
+        if first < 0:
+            return None, None, []
+
+        packets = []
+
+        # The map itself is given as source so that resynchronising searches
+        # it in place. All keys in parser are expected to be 16 bytes long.
+        parser = KLVParser(buffer, key_length=16, zero_copy=True, sync=UNIVERSAL_LABEL_PREFIX, offset=first)
+        key = value = None
+
+        while True:
+            position, skips = parser.tell(), len(parser.skipped)
+
+            try:
+                key, value = next(parser)
+            except StopIteration:
+                stopped = len(buffer)
+                break
+
+            # Spans skipped while resynchronising precede the packet.
+            position += sum(length for offset, length in parser.skipped[skips:])
+
+            if first + position >= stop:
+                stopped = first + position
+                break
+
+            # Copy the value out of the map so packets can be returned to the parent process.
+            packets.append(StreamParser.parse_packet(key, bytes(value)))
+
+        # Release the views of the map before it is closed.
+        del key, value, parser
+
+        return first, stopped, packets
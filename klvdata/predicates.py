@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Packet filters evaluated on framed bytes, before any set is parsed.
+
+Filters are passed to StreamParser as where. Each is a callable taking the
+framed key and value of a packet and returning True to keep the packet.
+Only the items a filter needs are located in the value and converted, so
+packets that do not match cost little more than framing.
+
+Packets other than UAS Local Sets, or without the items a filter needs,
+do not match.
+"""
+
+from datetime import datetime
+from klvdata.common import bytes_to_int
+from klvdata.common import datetime_to_microseconds
+from klvdata.klvparser import KLVParser
+from klvdata.misb0601 import PrecisionTimeStamp
+from klvdata.misb0601 import SensorLatitude
+from klvdata.misb0601 import SensorLongitude
+from klvdata.misb0601 import UASLocalMetadataSet
+
+
+def item_values(value, keys):
+    """Return dictionary of item key to item value bytes for keys found in a local set value.
+
+    The first item of each key is used and the scan stops once all keys are found.
+    """
+    keys = frozenset(keys)
+    found = {}
+
+    for key, data in KLVParser(value, key_length=1, zero_copy=True, keys=keys):
+        found.setdefault(bytes(key), data)
+
+        if len(found) == len(keys):
+            break
+
+    return found
+
+
+def time_between(start, stop):
+    """Return filter matching packets with a Precision Time Stamp from start to stop inclusive.
+
+    start and stop are datetimes or integer microseconds since the epoch. Time
+    stamps are compared as integers, no datetime is built per packet.
+    """
+    if isinstance(start, datetime):
+        start = datetime_to_microseconds(start)
+    if isinstance(stop, datetime):
+        stop = datetime_to_microseconds(stop)
+
+    keys = (PrecisionTimeStamp.key,)
+
+    def where(key, value):
+        if bytes(key) != UASLocalMetadataSet.key:
+            return False
+
+        data = item_values(value, keys).get(PrecisionTimeStamp.key)
+
+        return data is not None and start <= bytes_to_int(data) <= stop
+
+    return where
+
+
+def sensor_in_bbox(south, west, north, east):
+    """Return filter matching packets with a sensor position within the bounding box in degrees.
+
+    Bounds are inclusive. A box with west greater than east crosses the
+    antimeridian.
+    """
+    latitude = SensorLatitude.decoder()
+    longitude = SensorLongitude.decoder()
+    keys = (SensorLatitude.key, SensorLongitude.key)
+
+    def where(key, value):
+        if bytes(key) != UASLocalMetadataSet.key:
+            return False
+
+        found = item_values(value, keys)
+
+        try:
+            lat = latitude(found[SensorLatitude.key])
+            lon = longitude(found[SensorLongitude.key])
+        except (KeyError, ValueError):
+            return False
+
+        # Error values decode to None.
+        if lat is None or lon is None or not south <= lat <= north:
+            return False
+
+        if west <= east:
+            return west <= lon <= east
+        return lon >= west or lon <= east
+
+    return where
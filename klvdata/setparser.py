@@ -24,9 +24,14 @@
 # SOFTWARE.
 
 from pprint import pformat
+from struct import Struct
 from abc import ABCMeta
 from abc import abstractmethod
 from collections import OrderedDict
+from collections.abc import Mapping
+from collections.abc import MutableMapping
+from klvdata.common import ber_encode
+from klvdata.common import packet_checksum
 from klvdata.element import Element
 from klvdata.element import UnknownElement
 from klvdata.klvparser import KLVParser
@@ -36,12 +41,34 @@ class SetParser(Element, metaclass=ABCMeta):
     """Parsable Element. Not intended to be used directly. Always as super class."""
     _unknown_element = UnknownElement
 
-    def __init__(self, value, key_length=1):
-        """All parser needs is the value, no other information"""
-        super().__init__(self.key, value)
+    # Maximum number of value lengths, and of layouts per length, cached per set by decode.
+    layout_cache_size = 64
+    layouts_per_length = 4
+
+    __slots__ = ('key_length', 'lazy', 'tags', 'items', '_source_items')
+
+    def __init__(self, value, key_length=1, lazy=False, tags=None):
+        """All parser needs is the value, no other information
+
+        If lazy, only the offsets of items are recorded on init and each item
+        is parsed on first access through items.
+
+        If tags is given, only items with those tag numbers are parsed, others
+        are skipped while framing. Selected nested sets are parsed whole,
+        unless tags is a dictionary of tag number to the tags of the nested
+        set at that tag (None for all), e.g. {2: None, 48: {1, 2}}.
+
+        Until items are modified (set, deleted or any item value changed),
+        __bytes__ returns the parsed value as is. Modified sets are encoded
+        from their items, with the checksum recomputed for sets with a
+        checksum_key. Items skipped by tags are copied from the parsed value.
+        """
+        self.value = value
         if not hasattr(self, 'key_length'):
             self.key_length = key_length
-        self.items = OrderedDict()
+        self.lazy = lazy
+        self.tags = tags
+        self.items = LazyItems(self.parse_item) if lazy else OrderedDict()
         self.parse()
 
     def __getitem__(self, key):
@@ -58,13 +85,241 @@ class SetParser(Element, metaclass=ABCMeta):
 
         If a known parser is not available for key, parse as generic KLV element.
         """
-        for key, value in KLVParser(self.value, self.key_length):
+        keys = None if self.tags is None else self.tag_keys(self.tags)
+
+        if self.lazy:
+            self.items.clear()
+            for key, value in KLVParser(self.value, self.key_length, zero_copy=True, keys=keys):
+                self.items.defer(bytes(key), value)
+            self.items.changed = False
+            return
+
+        for key, value in KLVParser(self.value, self.key_length, keys=keys):
+            self.items[key] = self.parse_item(key, value)
+
+        # Items as parsed, to detect items set or deleted since.
+        self._source_items = tuple(self.items.values())
+
+    @property
+    def modified(self):
+        """bool: True if items were set or deleted, or any item was modified, since parsed."""
+        if self.lazy:
+            if self.items.changed:
+                return True
+            items = self.items.parsed()
+        else:
+            items = tuple(self.items.values())
+            source = getattr(self, '_source_items', ())
+            if len(items) != len(source) or any(item is not parsed for item, parsed in zip(items, source)):
+                return True
+
+        return any(item.modified for item in items)
+
+    def encode(self):
+        """Return set value encoded from items.
+
+        Deferred items of lazy sets are copied from their unparsed values. If
+        the set was parsed with tags, the items are spliced into the parsed
+        value, see splice. If the set has a checksum_key, the checksum item
+        is recomputed over the whole packet and placed last.
+        """
+        checksum_key = getattr(self, 'checksum_key', None)
+        checksum = checksum_key in self.items
+
+        if self.tags is not None:
+            value, parsed_checksum = self.splice(exclude=checksum_key)
+            checksum = checksum or parsed_checksum
+        elif self.lazy:
+            value = self.items.encode(exclude=checksum_key)
+        else:
+            value = b''.join(bytes(item) for key, item in self.items.items() if key != checksum_key)
+
+        if checksum_key is not None and checksum:
+            value += checksum_key + b'\x02'
+            packet = bytes(self.key) + ber_encode(len(value) + 2) + value
+            value += packet_checksum(packet + b'\x00\x00')
+
+        return value
+
+    def splice(self, exclude=None):
+        """Return tuple of value with its projected items replaced by items, and whether exclude was found.
+
+        Items not selected by tags are copied as parsed. Each projected item
+        is written in place of its first occurrence, or dropped if deleted
+        from items. Items added to items are appended. Items with key exclude
+        are left out.
+        """
+        keys = self.tag_keys(self.tags)
+        parser = KLVParser(self.value, self.key_length, zero_copy=True)
+        pieces, written, found = [], set(), False
+
+        for key, value in parser:
+            key = bytes(key)
+
+            if key == exclude:
+                found = True
+            elif key not in keys:
+                pieces.append(bytes(self.value[parser.triplet_offset:parser.tell()]))
+            elif key in self.items and key not in written:
+                pieces.append(bytes(self.items[key]))
+                written.add(key)
+
+        pieces.extend(bytes(item) for key, item in self.items.items() if key not in written and key != exclude)
+
+        return b''.join(pieces), found
+
+    def __bytes__(self):
+        """Return the encoded set, the parsed bytes unless modified."""
+        value = self.encode() if self.modified else bytes(self.value)
+        return bytes(self.key) + ber_encode(len(value)) + value
+
+    def __len__(self):
+        """Return the byte length of the encoded set value."""
+        if self.value is None:
+            return 0
+        if self.modified:
+            return len(self.encode())
+        return len(self.value)
+
+    def parse_item(self, key, value):
+        """Return element parsed from key and value, or an unknown element if no parser accepts it."""
+        try:
+            if issubclass(self.parsers[key], SetParser):
+                return self.parsers[key](value, lazy=self.lazy, tags=self.item_tags(key))
+            return self.parsers[key](value)
+        except (KeyError, TypeError):
+            return self._unknown_element(key, value)
+        except ValueError:
+            return self._unknown_element(key, value)
+
+    def item_tags(self, key):
+        """Return tags of the nested set at key, from tags if it is a dictionary, else None."""
+        if not isinstance(self.tags, Mapping):
+            return None
+
+        tag = getattr(self.parsers.get(key), 'TAG', None)
+        if tag is None and len(key) == 1:
+            tag = key[0]
+
+        return self.tags.get(tag)
+
+    @classmethod
+    def decode(cls, value):
+        """Return OrderedDict of key to plain Python value decoded from set value.
+
+        Items are converted with the compiled decoder table instead of being
+        built as element objects. Nested sets decode to nested dictionaries.
+        Items without a parser, or whose decoder rejects the value, are
+        returned as bytes.
+
+        The layouts of decoded values (keys and lengths of their items) are
+        cached by value length. A later value with one of the layouts of its
+        length is decoded with a single struct unpack and no framing loop.
+        Values whose layout matches but whose items a converter rejects are
+        framed without replacing the layout.
+        """
+        layouts = cls.__dict__.get('_layouts')
+        if layouts is None:
+            layouts = cls._layouts = {}
+
+        candidates = layouts.get(len(value), ())
+        for layout in candidates:
             try:
-                self.items[key] = self.parsers[key](value)
-            except (KeyError, TypeError):
-                self.items[key] = self._unknown_element(key, value)
-            except ValueError:
-                self.items[key] = self._unknown_element(key, value)
+                items = layout.decode(value)
+            except (TypeError, ValueError):
+                # Let the framing loop decide item by item.
+                return cls._frame(value)
+            if items is not None:
+                return items
+
+        items, layout = cls._frame(value, compile_layout=True)
+
+        if layout is not None:
+            if len(candidates) >= cls.layouts_per_length:
+                candidates = candidates[1:]
+            elif not candidates and len(layouts) >= cls.layout_cache_size:
+                layouts.clear()
+            layouts[len(value)] = candidates + (layout,)
+
+        return items
+
+    @classmethod
+    def _frame(cls, value, compile_layout=False):
+        """Return OrderedDict decoded from value by framing each item.
+
+        If compile_layout, returns a tuple of items and the PacketLayout of
+        value, or None if value holds trailing bytes.
+        """
+        decoders = cls.__dict__.get('_decoders') or cls.compile()
+        key_length = getattr(cls, 'key_length', 1)
+
+        items = OrderedDict()
+        fields = []
+        offset, end = 0, len(value)
+
+        while offset + key_length < end:
+            position = offset + key_length
+            key = bytes(value[offset:position])
+            byte_length = value[position]
+
+            if byte_length < 128:
+                # BER Short Form
+                start, length = position + 1, byte_length
+            else:
+                # BER Long Form
+                start = position + 1 + byte_length - 128
+                length = int.from_bytes(value[position + 1:start], byteorder='big')
+
+            fields.append((key, bytes(value[offset:start]), length))
+
+            offset = start + length
+            data = value[start:offset]
+
+            try:
+                items[key] = decoders[key](data)
+            except KeyError:
+                items[key] = bytes(data)
+            except (TypeError, ValueError):
+                items[key] = bytes(data)
+
+        if not compile_layout:
+            return items
+
+        # Only layouts that account for every byte of the value are reusable.
+        return items, PacketLayout(cls, fields, decoders) if offset == end else None
+
+    @classmethod
+    def decoder(cls):
+        return cls.decode
+
+    @classmethod
+    def compile(cls):
+        """Return and store table of key to decode function built from the registered parsers."""
+        decoders = {}
+
+        for key, parser in cls.parsers.items():
+            if hasattr(parser, 'decoder'):
+                decoders[key] = parser.decoder()
+
+        cls._decoders = decoders
+        cls._layouts = None
+
+        return decoders
+
+    @classmethod
+    def tag_keys(cls, tags):
+        """Return set of item keys for tag numbers.
+
+        Keys of registered parsers with a matching TAG are included. For sets
+        with single byte keys, the tag number itself is also used as key so
+        that tags without a registered parser can be selected.
+        """
+        keys = {key for key, parser in cls.parsers.items() if getattr(parser, 'TAG', None) in tags}
+
+        if getattr(cls, 'key_length', 1) == 1:
+            keys.update(bytes([tag]) for tag in tags if 0 <= tag < 256)
+
+        return frozenset(keys)
 
     @classmethod
     def add_parser(cls, obj):
@@ -80,6 +335,14 @@ class SetParser(Element, metaclass=ABCMeta):
         # parsers.
         cls.parsers[bytes(obj.key)] = obj
 
+        # Mapped element parsers precompute their conversion constants once here.
+        if hasattr(obj, 'precompute'):
+            obj.precompute()
+
+        # Decoder table and layout cache are rebuilt on next decode.
+        cls._decoders = None
+        cls._layouts = None
+
         return obj
 
     @property
@@ -97,7 +360,7 @@ class SetParser(Element, metaclass=ABCMeta):
         pass
 
     def __repr__(self):
-        return pformat(self.items, indent=1)
+        return pformat(OrderedDict(self.items), indent=1)
 
     def __str__(self):
         return str_dict(self.items)
@@ -131,6 +394,118 @@ class SetParser(Element, metaclass=ABCMeta):
         repeat(self.items.values())
 
 
+class PacketLayout(object):
+    """Compiled layout of a set value used by SetParser.decode.
+
+    Each item contributes its key and length header followed by its value to
+    a single struct format. Values with a fixed width integer representation
+    (mapped and time stamp elements) are unpacked as integers, all others as
+    bytes passed to the item decoder.
+    """
+    def __init__(self, set_parser, fields, decoders):
+        format = ['>']
+        self.keys = []
+        self.converters = []
+        headers = []
+
+        for key, header, length in fields:
+            parser = set_parser.parsers.get(key)
+            field = getattr(parser, 'struct_field', None)
+            field = field(length) if field is not None else None
+
+            if field is None:
+                field = '{}s'.format(length), decoders.get(key, bytes)
+
+            format.append('{}s'.format(len(header)))
+            format.append(field[0])
+            headers.append(header)
+            self.keys.append(key)
+            self.converters.append(field[1])
+
+        self.headers = tuple(headers)
+        self.struct = Struct(''.join(format))
+
+    def decode(self, value):
+        """Return OrderedDict of key to plain value, or None if value does not match the layout.
+
+        Raises TypeError or ValueError if a converter rejects an item.
+        """
+        fields = self.struct.unpack(value)
+
+        if fields[0::2] != self.headers:
+            return None
+
+        values = [convert(field) for convert, field in zip(self.converters, fields[1::2])]
+
+        return OrderedDict(zip(self.keys, values))
+
+
+class LazyItems(MutableMapping):
+    """Ordered mapping of key to element that parses each element on first access.
+
+    Deferred values are held as given (typically memoryview slices of the
+    parent set value) and copied to bytes when parsed by parse_item.
+
+    changed is set when items are set or deleted.
+    """
+    def __init__(self, parse_item):
+        self._parse_item = parse_item
+        self._items = OrderedDict()
+        self._deferred = {}
+        self.changed = False
+
+    def defer(self, key, value):
+        """Set key to be parsed from value on first access."""
+        self._items[key] = None
+        self._deferred[key] = value
+
+    def __getitem__(self, key):
+        if key in self._deferred:
+            self._items[key] = self._parse_item(key, bytes(self._deferred.pop(key)))
+        return self._items[key]
+
+    def __setitem__(self, key, value):
+        self._deferred.pop(key, None)
+        self._items[key] = value
+        self.changed = True
+
+    def __delitem__(self, key):
+        self._deferred.pop(key, None)
+        del self._items[key]
+        self.changed = True
+
+    def parsed(self):
+        """Return list of the elements parsed so far."""
+        return [item for key, item in self._items.items() if key not in self._deferred]
+
+    def encode(self, exclude=None):
+        """Return items encoded as bytes, deferred items without parsing them."""
+        out = []
+
+        for key, item in self._items.items():
+            if key == exclude:
+                continue
+            if key in self._deferred:
+                value = self._deferred[key]
+                out.append(key + ber_encode(len(value)) + bytes(value))
+            else:
+                out.append(bytes(item))
+
+        return b''.join(out)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return repr(OrderedDict(self.items()))
+
+
 def str_dict(values):
     out = []
 
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from klvdata.elementparser import DateTimeValue
+
+
+class StateTracker(object):
+    """Current value of every item seen in a stream of sets.
+
+    Producers omit items that did not change from most packets. Each packet
+    passed to update is merged into state, replacing only the items it
+    carries, and changed is set to the keys whose value differs from the
+    previous one. state therefore always holds the full current picture at
+    a cost proportional to the items of each packet.
+
+    Packets are parsed sets (UASLocalMetadataSet) or dictionaries of plain
+    values as returned by SetParser.decode. metadata holds the state in the
+    format of SetParser.MetadataList and is only updated for changed items.
+
+    Attributes:
+        state: OrderedDict of item key to the last element or value seen.
+        changed: set of item keys changed by the last update.
+        metadata: OrderedDict of tag to (LDSName, ESDName, UDSName, value string).
+    """
+
+    def __init__(self):
+        self.state = OrderedDict()
+        self.changed = set()
+        self.metadata = OrderedDict()
+
+    def update(self, packet):
+        """Merge items of packet into state and return set of item keys whose value changed."""
+        items = packet if isinstance(packet, Mapping) else packet.items
+
+        state = self.state
+        changed = set()
+
+        for key, item in items.items():
+            if key not in state or _compare_value(state[key]) != _compare_value(item):
+                changed.add(key)
+                self._update_metadata(item)
+
+            state[key] = item
+
+        self.changed = changed
+
+        return changed
+
+    def _update_metadata(self, item):
+        # Same entries as SetParser.MetadataList, nested sets included.
+        try:
+            self.metadata[item.TAG] = (item.LDSName, item.ESDName, item.UDSName, str(item.value.value))
+        except AttributeError:
+            pass
+
+        # Nested sets, not dictionaries of plain values.
+        nested = getattr(item, 'items', None)
+        if isinstance(nested, Mapping):
+            for nested_item in nested.values():
+                self._update_metadata(nested_item)
+
+
+def _compare_value(item):
+    """Return plain value of an element or value used to detect changes."""
+    value = getattr(item, 'value', item)
+
+    # Avoid building a datetime per packet.
+    if isinstance(value, DateTimeValue):
+        return value.microseconds
+
+    return getattr(value, 'value', value)
@@ -23,28 +23,110 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from collections import deque
+from klvdata.common import packet_checksum
 from klvdata.element import UnknownElement
 
 from klvdata.klvparser import KLVParser
+from klvdata.klvparser import UNIVERSAL_LABEL_PREFIX
+from klvdata.klvparser import frame_length
+from klvdata.setparser import SetParser
 
 
 class StreamParser:
     parsers = {}
 
-    def __init__(self, source):
+    def __init__(self, source, zero_copy=False, resync=False, keys=None, lazy=False, tags=None, plain=False,
+                 where=None, validate_checksum=False):
+        """If where is given, it is called with the framed key and value of each
+        packet and only packets for which it returns True are parsed. See
+        klvdata.predicates for filters reading items from the framed bytes.
+
+        If validate_checksum is set, the checksum of packets of sets with a
+        checksum_key (UAS Local Sets) is computed from the framed bytes before
+        parsing. Packets whose last item is not a matching checksum are
+        recorded in invalid and dropped, or still returned if
+        validate_checksum is 'flag'.
+        """
         self.source = source
+        self.lazy = lazy
+        self.tags = tags
+        self.plain = plain
+        self.where = where
+        self.validate_checksum = validate_checksum
+        self.invalid = []
+
+        # Corrupt packets are skipped by scanning ahead for the next key.
+        sync = UNIVERSAL_LABEL_PREFIX if resync else None
 
         # All keys in parser are expected to be 16 bytes long.
-        self.iter_stream = KLVParser(self.source, key_length=16)
+        self.iter_stream = KLVParser(self.source, key_length=16, zero_copy=zero_copy, sync=sync, keys=keys)
 
     def __iter__(self):
         return self
 
+    @property
+    def skipped(self):
+        """list: (offset, length) of source spans skipped while resynchronising."""
+        return self.iter_stream.skipped
+
     def __next__(self):
-        key, value = next(self.iter_stream)
+        while True:
+            key, value = next(self.iter_stream)
+
+            if self.where is not None and not self.where(key, value):
+                continue
+
+            if self.validate_checksum and not self._checksum_valid(key, value):
+                start = self.iter_stream.triplet_offset
+                self.invalid.append((start, self.iter_stream.tell() - start))
+
+                if self.validate_checksum != 'flag':
+                    continue
+
+            return self.parse_packet(key, value, lazy=self.lazy, tags=self.tags, plain=self.plain)
+
+    def _checksum_valid(self, key, value):
+        """Return False if the packet of the last framed key and value has a wrong or missing checksum."""
+        key = bytes(key)
+        checksum_key = getattr(self.parsers.get(key), 'checksum_key', None)
+
+        if checksum_key is None:
+            return True
+
+        if value[-4:-2] != checksum_key + b'\x02':
+            return False
+
+        # Rebuild the BER length as framed, from its size in the source.
+        length = len(value)
+        size = self.iter_stream.tell() - self.iter_stream.triplet_offset - len(key) - length
 
-        if key in self.parsers:
-            return self.parsers[key](value)
+        if size == 1:
+            header = bytes([length])
+        else:
+            header = bytes([127 + size]) + length.to_bytes(size - 1, byteorder='big')
+
+        return packet_checksum(value, prefix=key + header) == value[-2:]
+
+    @classmethod
+    def parse_packet(cls, key, value, lazy=False, tags=None, plain=False):
+        """Return element parsed from a framed key and value.
+
+        If lazy, sets defer parsing their items until first accessed. If tags
+        is given, sets only parse items with those tag numbers, see
+        SetParser for the tags of nested sets. If plain, sets
+        are returned as dictionaries of plain values from SetParser.decode.
+        """
+        # Keys framed in zero copy mode are memoryview slices, which are not
+        # hashable when the source is writable (bytearray, mmap).
+        key = bytes(key)
+
+        if key in cls.parsers:
+            if plain and issubclass(cls.parsers[key], SetParser):
+                return cls.parsers[key].decode(value)
+            if issubclass(cls.parsers[key], SetParser):
+                return cls.parsers[key](value, lazy=lazy, tags=tags)
+            return cls.parsers[key](value)
         else:
             # Even if KLV is not known, make best effort to parse and preserve.
             # Element is an abstract super class, do not create instances on Element.
@@ -60,3 +142,87 @@ class StreamParser:
         cls.parsers[bytes(obj.key)] = obj
 
         return obj
+
+
+class FeedParser:
+    """Push style counterpart of StreamParser for data arriving in fragments.
+
+    Each call to feed() appends a chunk and returns the packets completed so
+    far, parsed as StreamParser would. Trailing bytes of an incomplete packet
+    are kept until later chunks complete it. Consumed bytes are released only
+    once they make up half of the buffer, so the cost of feeding is linear in
+    the number of bytes fed.
+    """
+    # All keys in parser are expected to be 16 bytes long.
+    key_length = 16
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._offset = 0
+
+    @property
+    def pending(self):
+        """int: Number of buffered bytes not yet parsed as a packet."""
+        return len(self._buffer) - self._offset
+
+    def feed(self, data):
+        """Append data and return list of packets completed by it."""
+        self._buffer += data
+
+        packets = []
+
+        while True:
+            lengths = frame_length(self._buffer, self._offset, self.key_length)
+
+            if lengths is None:
+                break
+
+            header, length = lengths
+            start, end = self._offset, self._offset + header + length
+
+            if end > len(self._buffer):
+                break
+
+            with memoryview(self._buffer) as view:
+                key = bytes(view[start:start + self.key_length])
+                value = bytes(view[start + header:end])
+
+            packets.append(StreamParser.parse_packet(key, value))
+            self._offset = end
+
+        if self._offset > len(self._buffer) // 2:
+            del self._buffer[:self._offset]
+            self._offset = 0
+
+        return packets
+
+
+class AsyncStreamParser:
+    """Asynchronous iterator of packets read from an asyncio.StreamReader.
+
+    Data is read in blocks of up to block_size bytes and framed by a
+    FeedParser, so packets are parsed as StreamParser would.
+
+        async for packet in AsyncStreamParser(reader):
+            ...
+    """
+    def __init__(self, reader, block_size=2**16):
+        self.reader = reader
+        self.block_size = block_size
+
+        self._parser = FeedParser()
+        self._packets = deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._packets:
+            data = await self.reader.read(self.block_size)
+
+            if not data:
+                raise StopAsyncIteration
+
+            self._packets.extend(self._parser.feed(data))
+
+        return self._packets.popleft()
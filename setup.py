@@ -72,6 +72,11 @@ setup(
     packages=['klvdata'],
     test_suite="test",
 
+    # NumPy is only required by the batch operations in klvdata.columnar.
+    extras_require={
+        'numpy': ['numpy'],
+    },
+
     python_requires='>=3.5',
 )
 
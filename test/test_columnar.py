@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy not installed")
+class FrameArray(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.constant = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.dynamic = f.read()
+
+    def test_frame(self):
+        from klvdata.columnar import frame_array
+
+        key_offsets, value_offsets, value_lengths = frame_array(self.constant + self.dynamic)
+
+        self.assertEqual(key_offsets.tolist(), [0, len(self.constant)])
+        self.assertEqual(value_offsets.tolist(), [18, len(self.constant) + 17])
+        self.assertEqual(value_lengths.tolist(), [len(self.constant) - 18, len(self.dynamic) - 17])
+
+    def test_matches_resync(self):
+        from klvdata.columnar import frame_array
+        from klvdata.klvparser import KLVParser
+        from klvdata.klvparser import UNIVERSAL_LABEL_PREFIX
+
+        # A universal set carrying a whole packet yields a prefix match inside its value.
+        wrapper = b'\x06\x0e\x2b\x34' + b'\x01' * 12 + bytes([len(self.dynamic)]) + self.dynamic
+
+        stream = (b'junk' + self.constant + self.dynamic + self.constant[:60] + self.dynamic * 3 +
+                  wrapper * 2 + self.dynamic + b'\x06\x0e')
+
+        key_offsets, value_offsets, value_lengths = frame_array(stream)
+        values = [stream[start:start + length] for start, length in zip(value_offsets, value_lengths)]
+
+        parser = KLVParser(stream, key_length=16, sync=UNIVERSAL_LABEL_PREFIX)
+        self.assertEqual(values, [value for key, value in parser])
+
+    def test_empty(self):
+        from klvdata.columnar import frame_array
+
+        for array in frame_array(b''):
+            self.assertEqual(len(array), 0)
+
+
+
+@unittest.skipIf(numpy is None, "NumPy not installed")
+class Decode(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.constant = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.dynamic = f.read()
+
+    def test_matches_set_decode(self):
+        from klvdata.columnar import decode
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        columns = decode(self.constant + self.dynamic)
+        packets = [UASLocalMetadataSet.decode(self.constant[18:]), UASLocalMetadataSet.decode(self.dynamic[17:])]
+
+        self.assertEqual(list(columns), list(packets[0]))
+
+        for key, column in columns.items():
+            for row, packet in enumerate(packets):
+                with self.subTest(key=key, row=row):
+                    if key not in packet:
+                        self.assertIs(column[row], numpy.ma.masked)
+                    elif column.dtype == numpy.float64:
+                        self.assertEqual(repr(float(column[row])), repr(packet[key]))
+                    elif column.dtype == numpy.int64:
+                        self.assertEqual(int(column[row]), int(packet[key].timestamp() * 1e6))
+                    else:
+                        self.assertEqual(column[row], packet[key])
+
+    def test_columns(self):
+        from klvdata.columnar import decode
+
+        columns = decode(self.constant + self.dynamic * 2)
+
+        self.assertEqual(columns[b'\x02'].dtype, numpy.int64)
+        self.assertEqual(columns[b'\x02'][0], 1231798102000000)
+        self.assertEqual(columns[b'\x0d'].dtype, numpy.float64)
+        self.assertEqual(columns[b'\x03'].dtype, object)
+
+        # Strings only present in the first packet.
+        self.assertEqual(columns[b'\x03'].mask.tolist(), [False, True, True])
+        self.assertEqual(columns[b'\x03'][0], 'Mission 12')
+
+    def test_error_value(self):
+        from klvdata.columnar import decode
+
+        # Sensor latitude (tag 13) error value 0x80000000.
+        offset = self.constant.index(b'\x0d\x04') + 2
+        packet = self.constant[:offset] + b'\x80\x00\x00\x00' + self.constant[offset + 4:]
+
+        self.assertIs(decode(packet)[b'\x0d'][0], numpy.ma.masked)
+
+    def test_checksum_valid(self):
+        from klvdata.columnar import checksum_valid
+        from klvdata.columnar import frame_array
+        from klvdata.common import packet_checksum
+
+        # Packets starting at odd and even offsets.
+        stream = b'x' + self.dynamic + self.constant + self.dynamic * 2
+
+        key_offsets, value_offsets, value_lengths = frame_array(stream)
+        expected = [packet_checksum(stream[start:end]) == stream[end - 2:end]
+                    for start, end in zip(key_offsets, value_offsets + value_lengths)]
+
+        self.assertEqual(expected, [True, False, True, True])
+        self.assertEqual(checksum_valid(stream).tolist(), expected)
+        self.assertEqual(checksum_valid(b'').tolist(), [])
+
+    def test_empty(self):
+        from klvdata.columnar import decode
+
+        self.assertEqual(decode(b''), {})
+
+
+
+@unittest.skipIf(numpy is None, "NumPy not installed")
+class Encode(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.dynamic = f.read()
+
+    def test_round_trip(self):
+        from klvdata.columnar import decode
+        from klvdata.columnar import encode
+
+        # The checksum column is left out and recomputed.
+        self.assertEqual(encode(decode(self.dynamic * 3)), self.dynamic * 3)
+
+    def test_round_trip_nested(self):
+        from klvdata.columnar import decode
+        from klvdata.columnar import encode
+        from klvdata.streamparser import StreamParser
+
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            constant = f.read()
+
+        columns = decode(constant * 3)
+        stream = encode(columns)
+
+        # The sample checksum differs from the one computed, other items are equal.
+        self.assertEqual(len(stream), len(constant) * 3)
+        for start in range(0, len(stream), len(constant)):
+            self.assertEqual(stream[start:start + len(constant) - 2], constant[:-2])
+        self.assertEqual(len(list(StreamParser(stream, validate_checksum=True))), 3)
+        self.assertEqual(decode(stream)[b'\x30'].tolist(), columns[b'\x30'].tolist())
+
+    def test_matches_builder(self):
+        from klvdata.columnar import encode
+        from klvdata.packetbuilder import UASPacketBuilder
+
+        rows = [
+            {2: 1231798102000000, 3: 'Mission 12', 13: 60.176822966978335, 14: 128.42675904204452},
+            {2: 1231798102000001, 13: -45.5, 14: float('nan')},
+            {2: 1231798102000002, 3: 'M' * 200, 13: 0.0, 14: -180.0},
+        ]
+
+        stream = encode({
+            2: numpy.array([row[2] for row in rows]),
+            3: numpy.ma.masked_array(['Mission 12', '', 'M' * 200], mask=[False, True, False], dtype=object),
+            13: numpy.array([row[13] for row in rows]),
+            14: numpy.array([row[14] for row in rows]),
+        })
+
+        # NaN is the error value.
+        rows[1][14] = None
+
+        builder = UASPacketBuilder()
+        self.assertEqual(stream, b''.join(builder.build(row) for row in rows))
+
+    def test_datetime64(self):
+        from klvdata.columnar import encode
+
+        stream = encode({2: numpy.array(['2009-01-12T22:08:22'], dtype='datetime64[s]')})
+
+        self.assertEqual(stream[17:27], b'\x02\x08\x00\x04\x60\x50\x58\x4E\x01\x80')
+
+    def test_errors(self):
+        from klvdata.columnar import encode
+
+        with self.assertRaises(ValueError):
+            encode({13: numpy.array([0.0, 91.0])})
+
+        with self.assertRaises(ValueError):
+            encode({13: numpy.array([0.0]), 14: numpy.array([0.0, 1.0])})
+
+    def test_empty(self):
+        from klvdata.columnar import encode
+
+        self.assertEqual(encode({13: numpy.array([])}), b'')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,6 +34,42 @@ class DateTime(unittest.TestCase):
             datetime_to_bytes(bytes_to_datetime(b'\x00\x04\x60\x50\x58\x4E\x01\x80')),
             b'\x00\x04\x60\x50\x58\x4E\x01\x80')
 
+    def test_datetime_exact(self):
+        from klvdata.common import datetime_to_bytes
+        from klvdata.common import bytes_to_datetime
+
+        # Past 2106 float seconds can no longer hold every microsecond.
+        for value in (b'\x00\x00\x00\x00\x00\x00\x00\x00',
+                      b'\x00\x0F\x42\x40\x00\x00\x00\x01',
+                      b'\x00\x73\x79\xEC\xBC\x4B\x00\x01'):
+            with self.subTest(value=value):
+                self.assertEqual(datetime_to_bytes(bytes_to_datetime(value)), value)
+
+    def test_microseconds(self):
+        from datetime import datetime
+        from datetime import timedelta
+        from datetime import timezone
+        from klvdata.common import datetime_to_microseconds
+        from klvdata.common import microseconds_to_datetime
+
+        value = datetime(2009, 1, 12, 22, 8, 22, 123456, tzinfo=timezone.utc)
+
+        self.assertEqual(datetime_to_microseconds(value), 1231798102123456)
+        self.assertEqual(microseconds_to_datetime(1231798102123456), value)
+        self.assertEqual(datetime_to_microseconds(value.astimezone(timezone(timedelta(hours=-5)))), 1231798102123456)
+
+        # Naive datetimes are local time.
+        naive = datetime(2009, 1, 12, 22, 8, 22, 123456)
+        self.assertEqual(datetime_to_microseconds(naive), round(naive.timestamp() * 1e6))
+
+        # Ambiguous local times follow fold, as timestamp does.
+        for fold in (0, 1):
+            naive = datetime(2020, 11, 1, 1, 30, 0, 250000, fold=fold)
+            self.assertEqual(datetime_to_microseconds(naive), round(naive.timestamp() * 1e6))
+
+        with self.assertRaises(ValueError):
+            microseconds_to_datetime(2**64 - 1)
+
 
 class BERLength(unittest.TestCase):
     def test_ber_decode_encode(self):
@@ -199,6 +235,51 @@ class FixedPoint(unittest.TestCase):
                 b'\x7F\xFF')
 
 
+class LinearMapping(unittest.TestCase):
+    def test_matches_fixed_point(self):
+        from klvdata.common import LinearMapping
+        from klvdata.common import bytes_to_float
+        from klvdata.common import float_to_bytes
+
+        for _domain, _range, _error in (
+                ((0, 2**16 - 1), (0, 360), None),
+                ((-(2**15 - 1), 2**15 - 1), (-20, 20), -2**15),
+                ((-(2**31 - 1), 2**31 - 1), (-90, 90), -2**31)):
+            mapping = LinearMapping(_domain, _range, _error)
+            length = mapping.length
+
+            for value in (b'\x00' * length, b'\x7F' + b'\xFF' * (length - 1), b'\x80' + b'\x01' * (length - 1)):
+                with self.subTest(_domain=_domain, value=value):
+                    decoded = mapping.decode(value)
+                    self.assertEqual(decoded, bytes_to_float(value, _domain, _range, _error))
+
+                    try:
+                        expected = float_to_bytes(decoded, _domain, _range, _error)
+                    except ValueError:
+                        # Rounding can leave the domain at its limits, both must agree.
+                        with self.assertRaises(ValueError):
+                            mapping.encode(decoded)
+                    else:
+                        self.assertEqual(mapping.encode(decoded), expected)
+
+    def test_error(self):
+        from klvdata.common import LinearMapping
+
+        mapping = LinearMapping((-(2**15 - 1), 2**15 - 1), (-20, 20), -2**15)
+
+        self.assertIsNone(mapping.decode(b'\x80\x00'))
+        self.assertEqual(mapping.encode(None), b'\x80\x00')
+
+        with self.assertRaises(ValueError):
+            mapping.encode(20.5)
+
+    def test_registered(self):
+        from klvdata.misb0601 import PlatformHeadingAngle
+
+        self.assertEqual(PlatformHeadingAngle._mapping.length, 2)
+        self.assertIs(PlatformHeadingAngle(b'\x71\xC2').value.mapping, PlatformHeadingAngle)
+
+
 class Checksum(unittest.TestCase):
     def test_basic1(self):
         # Sample data from MISB ST 0902.5. DynamicConstantMISMMSPacketData not used
@@ -220,6 +301,14 @@ class Checksum(unittest.TestCase):
         from klvdata.common import packet_checksum
         self.assertEqual(packet_checksum(packet), b'\x3E\x1e')
 
+    def test_prefix(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            packet = f.read()
+
+        from klvdata.common import packet_checksum
+        for split in (17, 18, 19):
+            self.assertEqual(packet_checksum(memoryview(packet)[split:], prefix=packet[:split]), b'\x3E\x1e')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -70,5 +70,134 @@ class ElementTLV(unittest.TestCase):
             UnknownElement)
 
 
+class ElementSlots(unittest.TestCase):
+    def test_library_slots(self):
+        import inspect
+        from klvdata import element, elementparser, setparser, misb0601, misb0102, misbEG0104
+        from klvdata.element import Element
+        from klvdata.elementparser import BaseValue
+
+        for module in (element, elementparser, setparser, misb0601, misb0102, misbEG0104):
+            for name, cls in inspect.getmembers(module, inspect.isclass):
+                if issubclass(cls, (Element, BaseValue)) and cls.__module__ == module.__name__:
+                    with self.subTest(cls=cls.__qualname__):
+                        self.assertIn('__slots__', cls.__dict__)
+
+        element = misb0601.PlatformHeadingAngle(b'\x71\xC2')
+        self.assertFalse(hasattr(element, '__dict__'))
+        self.assertFalse(hasattr(element.value, '__dict__'))
+
+    def test_subclass(self):
+        from klvdata.element import Element
+        from klvdata.elementparser import BytesElementParser
+        from klvdata.elementparser import MappedValue
+
+        class K(Element):
+            def __repr__(self):
+                return 'K'
+
+        class Extra(BytesElementParser):
+            key = b'\x7f'
+
+            def __init__(self, value):
+                super().__init__(value)
+                self.extra = 1
+
+        self.assertEqual(bytes(K(b'a', b'b')), b'a\x01b')
+        self.assertEqual(Extra(b'\x01').extra, 1)
+
+        # Definition given as values, as before mapping classes.
+        value = MappedValue(b'\x71\xC2', (0, 2**16 - 1), (0, 360), None)
+        self.assertAlmostEqual(value.value, 159.974, places=3)
+        self.assertEqual(bytes(value), b'\x71\xC2')
+
+    def test_pickle(self):
+        import pickle
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            klv = f.read()
+
+        packet = UASLocalMetadataSet(klv[18:])
+        copy = pickle.loads(pickle.dumps(packet))
+
+        self.assertEqual(bytes(copy), klv)
+        self.assertEqual(repr(copy), repr(packet))
+
+
+class SourceBytes(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.klv = f.read()
+
+    def test_unmodified(self):
+        from klvdata.misb0601 import SensorLatitude
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        # Returned as parsed, without mapping the value back to bytes.
+        element = SensorLatitude(b'\x55\x55\x55\x55')
+        self.assertFalse(element.modified)
+        self.assertEqual(bytes(element), b'\x0D\x04\x55\x55\x55\x55')
+
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                packet = UASLocalMetadataSet(self.klv[18:], lazy=lazy)
+                self.assertFalse(packet.modified)
+                self.assertEqual(bytes(packet), self.klv)
+                self.assertEqual(len(packet), len(self.klv) - 18)
+
+    def test_modified_value(self):
+        from klvdata.misb0601 import MissionID
+
+        element = MissionID(b'Mission 12')
+        element.value.value = 'Mission 13'
+        self.assertTrue(element.modified)
+        self.assertEqual(bytes(element), b'\x03\x0AMission 13')
+
+    def test_modified_set(self):
+        from klvdata.misb0601 import UASLocalMetadataSet
+        from klvdata.streamparser import StreamParser
+
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                packet = UASLocalMetadataSet(self.klv[18:], lazy=lazy)
+                packet[b'\x03'].value.value = 'MISSION02'
+                del packet.items[b'\x05']
+                self.assertTrue(packet.modified)
+
+                copy, = StreamParser(bytes(packet), validate_checksum=True)
+                self.assertEqual(str(copy[b'\x03'].value), 'MISSION02')
+                self.assertNotIn(b'\x05', copy.items)
+                self.assertEqual(list(copy.items)[-1], b'\x01')
+                self.assertEqual(len(packet), len(bytes(packet)) - 18)
+
+    def test_modified_unknown(self):
+        from klvdata.misb0601 import UASLocalMetadataSet
+        from klvdata.streamparser import StreamParser
+
+        packet = UASLocalMetadataSet(self.klv[18:])
+        packet[b'^'].value = b'\x01\x02'
+        self.assertTrue(packet.modified)
+
+        copy, = StreamParser(bytes(packet), validate_checksum=True)
+        self.assertEqual(copy[b'^'].value, b'\x01\x02')
+
+    def test_modified_tags(self):
+        from klvdata.misb0601 import UASLocalMetadataSet
+        from klvdata.streamparser import StreamParser
+
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                packet = UASLocalMetadataSet(self.klv[18:], lazy=lazy, tags={3, 5})
+                packet[b'\x03'].value.value = 'MISSION02'
+                del packet.items[b'\x05']
+
+                # Items not selected by tags are kept.
+                copy, = StreamParser(bytes(packet), validate_checksum=True)
+                expected = [key for key in UASLocalMetadataSet(self.klv[18:]).items if key != b'\x05']
+                self.assertEqual(list(copy.items), expected)
+                self.assertEqual(str(copy[b'\x03'].value), 'MISSION02')
+
+
 if __name__ == "__main__":
     unittest.main()
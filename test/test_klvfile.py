@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+
+import os
+import tempfile
+import unittest
+
+
+class KLVFileRandomAccess(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.constant = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.dynamic = f.read()
+
+        self.stream = (self.constant + self.dynamic) * 3
+
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.stream)
+
+        from klvdata.klvfile import KLVFile
+        self.file = KLVFile(self.path)
+
+    def tearDown(self):
+        self.file.close()
+        os.remove(self.path)
+
+    def test_len(self):
+        self.assertEqual(len(self.file), 6)
+
+    def test_offsets(self):
+        self.assertEqual(self.file.offsets[1], len(self.constant))
+        self.assertEqual(self.file.packet_bytes(1), self.dynamic)
+        self.assertEqual(sum(self.file.lengths), len(self.stream))
+
+    def test_index(self):
+        from klvdata.streamparser import StreamParser
+
+        expected = [bytes(packet) for packet in StreamParser(self.stream)]
+
+        self.assertEqual(bytes(self.file[0]), expected[0])
+        self.assertEqual(bytes(self.file[-1]), expected[-1])
+        self.assertEqual(type(self.file[3]), type(next(StreamParser(self.dynamic))))
+
+        with self.assertRaises(IndexError):
+            self.file[6]
+
+    def test_slice(self):
+        self.assertEqual([bytes(packet) for packet in self.file[1:4:2]], [self.dynamic, self.dynamic])
+
+    def test_reversed(self):
+        forward = [bytes(packet) for packet in self.file]
+        backward = [bytes(packet) for packet in reversed(self.file)]
+        self.assertEqual(forward[::-1], backward)
+
+
+class KLVFileEmpty(unittest.TestCase):
+    def test_empty(self):
+        from klvdata.klvfile import KLVFile
+
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+
+        try:
+            with KLVFile(path) as f:
+                self.assertEqual(len(f), 0)
+                self.assertEqual(list(f), [])
+        finally:
+            os.remove(path)
+
+
+class KLVFileOpenError(unittest.TestCase):
+    def test_closes_file(self):
+        from unittest import mock
+        from klvdata import klvfile
+
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+
+        opened = []
+
+        def tracking_open(*args, **kwargs):
+            opened.append(open(*args, **kwargs))
+            return opened[-1]
+
+        try:
+            with mock.patch.object(klvfile, 'open', tracking_open, create=True), \
+                    mock.patch.object(klvfile.PacketIndex, 'open', side_effect=RuntimeError):
+                with self.assertRaises(RuntimeError):
+                    klvfile.KLVFile(path, sidecar=True)
+
+            self.assertTrue(opened[0].closed)
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -104,6 +104,136 @@ class ParserSingleShort(unittest.TestCase):
         # Check __str__
         self.assertEqual(str(PrecisionTimeStamp(value)), "PrecisionTimeStamp: (b'\\x02', 8, 2009-01-12 22:08:22+00:00)")
 
+    def test_st0601_timestamp_microseconds(self):
+        from datetime import datetime
+        from datetime import timezone
+        from klvdata.misb0601 import PrecisionTimeStamp
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        element = PrecisionTimeStamp(b'\x00\x04\x60\x50\x58\x4E\x01\x80')
+        self.assertEqual(element.value.microseconds, 1231798102000000)
+        self.assertEqual(element.value.value, datetime(2009, 1, 12, 22, 8, 22, tzinfo=timezone.utc))
+
+        element.value.value = datetime(2009, 1, 12, 22, 8, 22, 1, tzinfo=timezone.utc)
+        self.assertEqual(element.value.microseconds, 1231798102000001)
+        self.assertEqual(bytes(element), b'\x02\x08\x00\x04\x60\x50\x58\x4E\x01\x81')
+
+        # Time stamps no datetime can hold are not parsed.
+        packet = UASLocalMetadataSet(b'\x02\x08\xff\xff\xff\xff\xff\xff\xff\xff')
+        self.assertNotIsInstance(packet[b'\x02'], PrecisionTimeStamp)
+
+    def test_st0601_lazy(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            klv = f.read()
+
+        value = klv[18:]
+
+        from klvdata.misb0601 import UASLocalMetadataSet
+        from klvdata.misb0601 import PrecisionTimeStamp
+
+        eager = UASLocalMetadataSet(value)
+        lazy = UASLocalMetadataSet(value, lazy=True)
+
+        # Only the accessed item is parsed.
+        self.assertIsInstance(lazy[b'\x02'], PrecisionTimeStamp)
+        self.assertEqual(len(lazy.items._deferred), len(lazy.items) - 1)
+
+        # Membership does not parse.
+        self.assertIn(b'\x03', lazy.items)
+        self.assertNotIn(b'\xff', lazy.items)
+        self.assertEqual(len(lazy.items._deferred), len(lazy.items) - 1)
+
+        self.assertEqual(list(lazy.items), list(eager.items))
+        self.assertEqual(bytes(lazy), klv)
+        self.assertEqual(str(lazy), str(eager))
+        self.assertEqual(repr(lazy), repr(eager))
+        self.assertEqual(lazy.MetadataList(), eager.MetadataList())
+        self.assertTrue(lazy[b'\x30'].lazy)
+
+    def test_st0601_tags(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            klv = f.read()
+
+        value = klv[18:]
+
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                packet = UASLocalMetadataSet(value, lazy=lazy, tags={2, 13, 14, 48, 1})
+
+                self.assertEqual(list(packet.items), [b'\x02', b'\x0d', b'\x0e', b'\x30', b'\x01'])
+                self.assertEqual(packet[b'\x0d'].value.value, UASLocalMetadataSet(value)[b'\x0d'].value.value)
+                self.assertEqual(bytes(packet), klv)
+
+                # Nested sets are parsed whole, their tag numbers are their own.
+                self.assertEqual(list(packet[b'\x30'].items), list(UASLocalMetadataSet(value)[b'\x30'].items))
+
+                # Unless given their own projection.
+                packet = UASLocalMetadataSet(value, lazy=lazy, tags={2: None, 48: {1, 2}})
+
+                self.assertEqual(list(packet.items), [b'\x02', b'\x30'])
+                self.assertEqual(list(packet[b'\x30'].items), [b'\x01', b'\x02'])
+
+    def test_st0601_decode(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            klv = f.read()
+
+        value = klv[18:]
+
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        packet = UASLocalMetadataSet(value)
+        values = UASLocalMetadataSet.decode(value)
+
+        self.assertEqual(list(values), list(packet.items))
+        self.assertEqual(values[b'\x02'], packet[b'\x02'].value.value)
+        self.assertEqual(values[b'\x03'], 'Mission 12')
+        self.assertEqual(values[b'\x0d'], packet[b'\x0d'].value.value)
+        self.assertEqual(values[b'\x01'], b'\xaa\x43')
+
+        # Nested sets decode to dictionaries, items without parser to bytes.
+        self.assertEqual(values[b'\x30'][b'\x01'], b'\x01')
+        self.assertEqual(values[b'\x5e'], bytes(packet[b'\x5e'].value))
+
+    def test_st0601_decode_layout(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            klv = f.read()
+
+        value = klv[18:]
+
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        UASLocalMetadataSet._layouts = None
+        framed = UASLocalMetadataSet.decode(value)
+
+        # Second decode of the same layout is a single struct unpack.
+        self.assertIn(len(value), UASLocalMetadataSet._layouts)
+        cached = UASLocalMetadataSet.decode(value)
+        self.assertEqual(list(cached), list(framed))
+        self.assertEqual(cached, framed)
+
+        # Same length but different keys falls back to framing.
+        offset = value.index(b'\x03\x0aMission 12')
+        other = value[:offset] + b'\x7f' + value[offset + 1:]
+        values = UASLocalMetadataSet.decode(other)
+        self.assertNotIn(b'\x03', values)
+        self.assertEqual(values[b'\x7f'], b'Mission 12')
+        self.assertEqual(values[b'\x0d'], framed[b'\x0d'])
+
+        # Both layouts of the length are kept and alternate without framing.
+        layouts = UASLocalMetadataSet._layouts[len(value)]
+        self.assertEqual(len(layouts), 2)
+        self.assertEqual(UASLocalMetadataSet.decode(value), framed)
+        self.assertEqual(UASLocalMetadataSet.decode(other), values)
+        self.assertIs(UASLocalMetadataSet._layouts[len(value)], layouts)
+
+        # A matching layout whose converter rejects an item is framed and kept.
+        offset = value.index(b'\x02\x08')
+        rejected = value[:offset + 2] + b'\xff' * 8 + value[offset + 10:]
+        self.assertEqual(UASLocalMetadataSet.decode(rejected)[b'\x02'], b'\xff' * 8)
+        self.assertIs(UASLocalMetadataSet._layouts[len(value)], layouts)
+
     # def test_st0601_mission(self):
     #     with open('./samples/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
     #         klv = f.read()
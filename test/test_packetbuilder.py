@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+
+
+import unittest
+
+
+class UASPacketBuilderBuild(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.dynamic = f.read()
+
+    def test_round_trip(self):
+        from klvdata.misb0601 import UASLocalMetadataSet
+        from klvdata.packetbuilder import UASPacketBuilder
+
+        values = UASLocalMetadataSet.decode(self.dynamic[17:])
+        del values[b'\x01']
+
+        builder = UASPacketBuilder()
+        values = {key[0]: value for key, value in values.items()}
+
+        self.assertEqual(builder.build(values), self.dynamic)
+        # Encoders are reused for later packets.
+        self.assertEqual(builder.build(values), self.dynamic)
+
+    def test_values(self):
+        from datetime import datetime
+        from datetime import timezone
+        from klvdata.common import packet_checksum
+        from klvdata.misb0601 import UASLocalMetadataSet
+        from klvdata.packetbuilder import UASPacketBuilder
+
+        packet = UASPacketBuilder().build({
+            2: datetime(2009, 1, 12, 22, 8, 22, tzinfo=timezone.utc),
+            3: 'Mission 12',
+            13: 60.176822966978335,
+            14: None,
+            48: b'\x01\x01\x01',
+        })
+
+        self.assertEqual(packet[:16], UASLocalMetadataSet.key)
+        self.assertEqual(packet[-4:-2], b'\x01\x02')
+        self.assertEqual(packet[-2:], packet_checksum(packet))
+
+        values = UASLocalMetadataSet.decode(packet[17:])
+        self.assertEqual(list(values), [b'\x02', b'\x03', b'\x0d', b'\x0e', b'\x30', b'\x01'])
+        self.assertEqual(values[b'\x02'], datetime(2009, 1, 12, 22, 8, 22, tzinfo=timezone.utc))
+        self.assertEqual(values[b'\x03'], 'Mission 12')
+        self.assertEqual(values[b'\x0d'], 60.176822966978335)
+        self.assertIsNone(values[b'\x0e'])
+        self.assertEqual(values[b'\x30'], {b'\x01': b'\x01'})
+
+    def test_long_form(self):
+        from klvdata.misb0601 import UASLocalMetadataSet
+        from klvdata.packetbuilder import UASPacketBuilder
+
+        packet = UASPacketBuilder().build({3: 'M' * 127, 10: 'P' * 127})
+
+        self.assertEqual(packet[16:19], b'\x82\x01\x06')
+        self.assertEqual(UASLocalMetadataSet.decode(packet[19:])[b'\x03'], 'M' * 127)
+
+    def test_errors(self):
+        from klvdata.packetbuilder import UASPacketBuilder
+
+        builder = UASPacketBuilder()
+
+        with self.assertRaises(ValueError):
+            builder.build({1: b'\x00\x00'})
+
+        with self.assertRaises(ValueError):
+            builder.build({13: 91.0})
+
+
+class Rewrite(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.klv = f.read()
+
+    def test_unchanged(self):
+        from klvdata.packetbuilder import UASPacketBuilder
+
+        self.assertEqual(UASPacketBuilder().rewrite(self.klv, {}), self.klv)
+
+    def test_replace_remove(self):
+        from klvdata.packetbuilder import UASPacketBuilder
+        from klvdata.streamparser import StreamParser
+
+        packet = UASPacketBuilder().rewrite(self.klv, {3: 'REDACTED', 5: None, 10: 'X', 13: 45.0})
+        copy, = StreamParser(packet, validate_checksum=True)
+
+        self.assertEqual(str(copy[b'\x03'].value), 'REDACTED')
+        self.assertNotIn(b'\x05', copy.items)
+        self.assertAlmostEqual(copy[b'\x0d'].value.value, 45.0)
+        self.assertEqual(list(copy.items)[-2:], [b'\x0a', b'\x01'])
+
+    def test_stream(self):
+        from io import BytesIO
+        from klvdata.packetbuilder import UASPacketBuilder
+        from klvdata.streamparser import StreamParser
+
+        destination = BytesIO()
+        count = UASPacketBuilder().rewrite_stream(BytesIO(self.klv * 3), destination, {3: None})
+
+        self.assertEqual(count, 3)
+        packets = list(StreamParser(destination.getvalue(), validate_checksum=True))
+        self.assertEqual(len(packets), 3)
+        self.assertTrue(all(b'\x03' not in packet.items for packet in packets))
+
+    def test_stream_copy(self):
+        from io import BytesIO
+        from klvdata.packetbuilder import UASPacketBuilder
+
+        # Other packets keep their long form length, and a truncated last packet its header.
+        other = b'\x06\x0e\x2b\x34' + b'\x01' * 12 + b'\x82\x00\x04' + b'abcd'
+        stream = other + self.klv + other[:-2]
+
+        for source in (stream, BytesIO(stream)):
+            with self.subTest(source=type(source).__name__):
+                destination = BytesIO()
+                UASPacketBuilder().rewrite_stream(source, destination, {})
+                self.assertEqual(destination.getvalue(), stream)
+
+    def test_errors(self):
+        from klvdata.packetbuilder import UASPacketBuilder
+
+        builder = UASPacketBuilder()
+
+        with self.assertRaises(ValueError):
+            builder.rewrite(self.klv, {1: None})
+
+        with self.assertRaises(ValueError):
+            builder.rewrite(b'\x00' * 20, {})
+
+        with self.assertRaises(ValueError):
+            builder.rewrite(self.klv[:-10], {})
+
+        # An item whose value runs past the end of the set.
+        with self.assertRaises(ValueError):
+            builder.rewrite(builder.set_parser.key + b'\x04\x0c\x10\x41\x42', {3: 'X'})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+
+import os
+import tempfile
+import unittest
+
+
+class PacketIndexSidecar(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.constant = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.dynamic = f.read()
+
+        self.stream = self.constant + self.dynamic
+
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.stream)
+
+        from klvdata.packetindex import sidecar_path
+        self.index_path = sidecar_path(self.path)
+
+    def tearDown(self):
+        for path in (self.path, self.index_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_build(self):
+        from klvdata.packetindex import PacketIndex
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        index = PacketIndex.build(self.stream, len(self.stream), 0)
+
+        self.assertEqual(list(index.offsets), [0, len(self.constant)])
+        self.assertEqual(list(index.lengths), [len(self.constant), len(self.dynamic)])
+        self.assertEqual(index.keys, UASLocalMetadataSet.key * 2)
+        self.assertEqual(index.key(1), UASLocalMetadataSet.key)
+        self.assertEqual(list(index.timestamps), [1231798102000000] * 2)
+
+    def test_save_load(self):
+        from klvdata.packetindex import PacketIndex
+
+        index = PacketIndex.build(self.stream, len(self.stream), 1234)
+        index.save(self.index_path)
+        loaded = PacketIndex.load(self.index_path)
+
+        self.assertEqual(loaded.offsets, index.offsets)
+        self.assertEqual(loaded.lengths, index.lengths)
+        self.assertEqual(loaded.keys, index.keys)
+        self.assertEqual(loaded.timestamps, index.timestamps)
+        self.assertEqual((loaded.size, loaded.mtime), (len(self.stream), 1234))
+
+    def test_load_error(self):
+        from klvdata.packetindex import PacketIndex
+
+        with open(self.index_path, 'wb') as f:
+            f.write(b'KLVI\x01')
+
+        with self.assertRaises(ValueError):
+            PacketIndex.load(self.index_path)
+
+    def test_klvfile_sidecar(self):
+        from klvdata.klvfile import KLVFile
+
+        with KLVFile(self.path, sidecar=True) as f:
+            self.assertEqual(len(f), 2)
+
+        self.assertTrue(os.path.exists(self.index_path))
+
+        with KLVFile(self.path, sidecar=True) as f:
+            self.assertEqual(bytes(f[1]), self.dynamic)
+
+    def test_stale_sidecar(self):
+        from klvdata.klvfile import KLVFile
+        from klvdata.packetindex import PacketIndex
+
+        with KLVFile(self.path, sidecar=True):
+            pass
+
+        with open(self.path, 'ab') as f:
+            f.write(self.constant)
+
+        with KLVFile(self.path, sidecar=True) as f:
+            self.assertEqual(len(f), 3)
+
+        self.assertEqual(len(PacketIndex.load(self.index_path)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+
+import os
+import tempfile
+import unittest
+
+
+class ParallelParseFile(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.constant = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.dynamic = f.read()
+
+        # A universal set carrying a whole packet as its value yields a false
+        # prefix match for any range starting inside it.
+        self.wrapper = b'\x06\x0e\x2b\x34' + b'\x01' * 12 + bytes([len(self.dynamic)]) + self.dynamic
+
+        self.stream = (b'junk' + (self.constant + self.wrapper + self.dynamic) * 5 +
+                       self.constant[:60] + self.dynamic * 3)
+
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.stream)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_matches_serial(self):
+        from klvdata.parallel import parse_file
+        from klvdata.streamparser import StreamParser
+
+        expected = [bytes(packet) for packet in StreamParser(self.stream, resync=True)]
+
+        for range_size in (50, 120, 333, 2**26):
+            with self.subTest(range_size=range_size):
+                packets = parse_file(self.path, max_workers=2, range_size=range_size)
+                self.assertEqual([bytes(packet) for packet in packets], expected)
+
+    def test_resync_memory(self):
+        import tracemalloc
+        from klvdata.parallel import _parse_range
+
+        # A corrupted key early in a range of a large file.
+        stream = bytearray(self.constant * 20000)
+        stream[len(self.constant) * 3] = 0
+
+        with open(self.path, 'wb') as f:
+            f.write(stream)
+
+        tracemalloc.start()
+        first, stopped, packets = _parse_range(self.path, 10, 2000)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.assertEqual(first, len(self.constant))
+        # The corrupted packet and the one before it, not followed by a key, are skipped.
+        self.assertEqual(len(packets), 6)
+        self.assertLess(peak, len(stream) // 10)
+
+    def test_empty(self):
+        from klvdata.parallel import parse_file
+
+        with open(self.path, 'wb'):
+            pass
+
+        self.assertEqual(parse_file(self.path, max_workers=1), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -74,5 +74,230 @@ class ParserSingleLong(ParserTestCase):
         self.assertEqual(value, self.value)
 
 
+class ParserBlocks(ParserTestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.packet = f.read()
+
+        self.stream = self.packet * 5
+
+    def test_block_boundaries(self):
+        from io import BufferedReader
+        from io import BytesIO
+        from klvdata.klvparser import KLVParser
+
+        sources = {
+            'BytesIO': lambda: BytesIO(self.stream),
+            'BufferedReader': lambda: BufferedReader(BytesIO(self.stream), buffer_size=16),
+        }
+
+        # Blocks smaller than a packet force partial triplets to be carried over.
+        for name, source in sources.items():
+            for block_size in (1, 7, 64, len(self.packet), 2**20):
+                with self.subTest(source=name, block_size=block_size):
+                    parser = KLVParser(source(), key_length=16, block_size=block_size)
+                    packets = list(parser)
+                    self.assertEqual(len(packets), 5)
+                    self.assertEqual(parser.tell(), len(self.stream))
+                    for key, value in packets:
+                        self.assertEqual(key, self.packet[0:16])
+                        self.assertEqual(value, self.packet[18:])
+
+    def test_unbuffered_source(self):
+        from io import BytesIO
+        from io import RawIOBase
+        from klvdata.klvparser import KLVParser
+
+        class Trickle(RawIOBase):
+            """Raw source returning at most 3 bytes per read."""
+            def __init__(self, data):
+                self.data = BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def readinto(self, b):
+                chunk = self.data.read(min(len(b), 3))
+                b[:len(chunk)] = chunk
+                return len(chunk)
+
+        packets = list(KLVParser(Trickle(self.stream), key_length=16))
+        self.assertEqual(len(packets), 5)
+        self.assertEqual(packets[-1], (self.packet[0:16], self.packet[18:]))
+
+    def test_truncated_value(self):
+        from io import BytesIO
+        from klvdata.klvparser import KLVParser
+
+        key, value = next(KLVParser(BytesIO(self.packet[:-10]), key_length=16, block_size=16))
+        self.assertEqual(value, self.packet[18:-10])
+
+
+class ParserZeroCopy(ParserTestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.packet = f.read()
+
+    def test_memoryview_slices(self):
+        from klvdata.klvparser import KLVParser
+
+        for source in (self.packet, bytearray(self.packet * 2)):
+            with self.subTest(source=type(source)):
+                for key, value in KLVParser(source, key_length=16, zero_copy=True):
+                    self.assertIsInstance(key, memoryview)
+                    self.assertIsInstance(value, memoryview)
+                    self.assertEqual(key, self.packet[0:16])
+                    self.assertEqual(value, self.packet[18:])
+
+    def test_mmap(self):
+        import mmap
+        from klvdata.klvparser import KLVParser
+
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                key, value = next(KLVParser(buffer, key_length=16, zero_copy=True))
+                self.assertEqual(value, self.packet[18:])
+                del key, value
+
+
+class ParserResync(ParserTestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.constant = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.dynamic = f.read()
+
+        # Corrupt the BER length of the dynamic packet into a bogus long form.
+        corrupt = bytearray(self.dynamic)
+        corrupt[16] = 0x84
+
+        self.stream = (b'junk' + self.constant + bytes(corrupt) + self.constant[:50] +
+                       self.constant + self.dynamic + b'\x06\x0e')
+
+        self.skipped = [
+            (0, 4),
+            (4 + len(self.constant), len(self.dynamic)),
+            (4 + len(self.constant) + len(self.dynamic), 50),
+            (len(self.stream) - 2, 2),
+        ]
+
+    def test_resync(self):
+        from io import BytesIO
+        from klvdata.klvparser import KLVParser
+        from klvdata.klvparser import UNIVERSAL_LABEL_PREFIX
+
+        sources = {
+            'bytes': lambda: self.stream,
+            'zero_copy': lambda: self.stream,
+            'memoryview': lambda: memoryview(self.stream),
+            'stream': lambda: BytesIO(self.stream),
+        }
+
+        for name, source in sources.items():
+            for block_size in (1, 7, 2**20):
+                with self.subTest(source=name, block_size=block_size):
+                    parser = KLVParser(source(), key_length=16, block_size=block_size,
+                                       zero_copy=(name in ('zero_copy', 'memoryview')), sync=UNIVERSAL_LABEL_PREFIX)
+
+                    values = [bytes(value) for key, value in parser]
+
+                    self.assertEqual(values, [self.constant[18:], self.constant[18:], self.dynamic[17:]])
+                    self.assertEqual(parser.skipped, self.skipped)
+
+    def test_offset(self):
+        from io import BytesIO
+        from klvdata.klvparser import KLVParser
+        from klvdata.klvparser import UNIVERSAL_LABEL_PREFIX
+
+        stream = self.constant + self.stream
+
+        for source, zero_copy in ((stream, True), (BytesIO(stream), False)):
+            with self.subTest(zero_copy=zero_copy):
+                parser = KLVParser(source, key_length=16, zero_copy=zero_copy, sync=UNIVERSAL_LABEL_PREFIX,
+                                   offset=len(self.constant))
+
+                self.assertEqual(len(list(parser)), 3)
+                self.assertEqual(parser.skipped, self.skipped)
+
+    def test_max_length(self):
+        from klvdata.klvparser import KLVParser
+        from klvdata.klvparser import UNIVERSAL_LABEL_PREFIX
+
+        parser = KLVParser(self.constant + self.dynamic, key_length=16, sync=UNIVERSAL_LABEL_PREFIX, max_length=200)
+
+        self.assertEqual([bytes(value) for key, value in parser], [self.dynamic[17:]])
+        self.assertEqual(parser.skipped, [(0, len(self.constant))])
+
+
+class FrameLength(ParserTestCase):
+    def test_frame_length(self):
+        from klvdata.klvparser import frame_length
+
+        self.assertEqual(frame_length(b'\x02\x08', 0, key_length=1), (2, 8))
+        self.assertEqual(frame_length(b'\x00\x02\x82\x01\x00', 1, key_length=1), (4, 256))
+
+    def test_incomplete(self):
+        from klvdata.klvparser import frame_length
+
+        self.assertIsNone(frame_length(b'\x02', 0, key_length=1))
+        self.assertIsNone(frame_length(b'\x02\x82\x01', 0, key_length=1))
+
+
+class ParserKeys(ParserTestCase):
+    def setUp(self):
+        from io import BytesIO
+
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.packet = f.read()
+
+        self.other = b'\x06\x0e\x2b\x34' + b'\x01' * 12 + b'\x82\x10\x00' + b'\xAA' * 4096
+        self.stream = self.other + self.packet + self.other + self.packet
+
+        class CountingBytesIO(BytesIO):
+            """In-memory stream counting the bytes returned by reads."""
+            count = 0
+            can_seek = True
+
+            def read(self, size=-1):
+                data = super().read(size)
+                self.count += len(data)
+                return data
+
+            read1 = read
+
+            def seekable(self):
+                return self.can_seek
+
+        self.source = CountingBytesIO
+
+    def test_keys(self):
+        from klvdata.klvparser import KLVParser
+
+        for block_size in (64, 2**20):
+            for seekable in (True, False):
+                with self.subTest(block_size=block_size, seekable=seekable):
+                    source = self.source(self.stream)
+                    source.can_seek = seekable
+
+                    parser = KLVParser(source, key_length=16, block_size=block_size, keys={self.packet[:16]})
+                    packets = list(parser)
+
+                    self.assertEqual(packets, [(self.packet[:16], self.packet[18:])] * 2)
+                    self.assertEqual(parser.tell(), len(self.stream))
+
+                    if seekable and block_size == 64:
+                        self.assertLess(source.count, 2 * len(self.other))
+
+    def test_keys_buffer(self):
+        from klvdata.klvparser import KLVParser
+        from klvdata.klvparser import UNIVERSAL_LABEL_PREFIX
+
+        for sync in (None, UNIVERSAL_LABEL_PREFIX):
+            with self.subTest(sync=sync):
+                parser = KLVParser(self.stream, key_length=16, zero_copy=True, sync=sync, keys={self.other[:16]})
+                self.assertEqual([bytes(value) for key, value in parser], [self.other[19:]] * 2)
+
+
 if __name__ == "__main__":
     unittest.main()
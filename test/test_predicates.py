@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+
+
+import unittest
+from datetime import datetime
+from datetime import timezone
+
+
+class Predicates(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.constant = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            dynamic = f.read()
+
+        # Same packet one second later and at the error latitude.
+        offset = dynamic.index(b'\x02\x08', 16) + 2
+        later = (1231798102000000 + 1000000).to_bytes(8, 'big')
+        self.later = dynamic[:offset] + later + dynamic[offset + 8:]
+
+        offset = self.later.index(b'\x0d\x04') + 2
+        self.unknown = self.later[:offset] + b'\x80\x00\x00\x00' + self.later[offset + 4:]
+
+    def test_item_values(self):
+        from klvdata.predicates import item_values
+
+        found = item_values(self.constant[18:], [b'\x0d', b'\x02', b'\xfe'])
+
+        self.assertEqual(sorted(found), [b'\x02', b'\x0d'])
+        self.assertEqual(bytes(found[b'\x02']), b'\x00\x04\x60\x50\x58\x4E\x01\x80')
+
+    def test_time_between(self):
+        from klvdata.predicates import time_between
+        from klvdata.streamparser import StreamParser
+
+        stream = self.constant + self.later + self.unknown
+
+        start = datetime(2009, 1, 12, 22, 8, 23, tzinfo=timezone.utc)
+        packets = list(StreamParser(stream, where=time_between(start, start)))
+        self.assertEqual([bytes(packet) for packet in packets], [self.later, self.unknown])
+
+        where = time_between(1231798102000000, 1231798102999999)
+        self.assertEqual([bytes(packet) for packet in StreamParser(stream, where=where)], [self.constant])
+
+    def test_sensor_in_bbox(self):
+        from klvdata.predicates import sensor_in_bbox
+        from klvdata.streamparser import StreamParser
+
+        stream = self.constant + self.unknown
+
+        packets = list(StreamParser(stream, where=sensor_in_bbox(60, 128, 61, 129)))
+        self.assertEqual([bytes(packet) for packet in packets], [self.constant])
+
+        # Box across the antimeridian.
+        self.assertEqual(list(StreamParser(stream, where=sensor_in_bbox(60, 170, 61, 120))), [])
+        self.assertEqual(len(list(StreamParser(stream, where=sensor_in_bbox(60, 120, 61, -170)))), 1)
+
+    def test_other_packets(self):
+        from klvdata.predicates import time_between
+        from klvdata.streamparser import StreamParser
+
+        unknown = b'\x06\x0e\x2b\x34' + bytes(12) + b'\x01\x00'
+
+        self.assertEqual(list(StreamParser(unknown, where=time_between(0, 2**63))), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
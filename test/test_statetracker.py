@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+# The MIT License (MIT)
+#
+# Copyright (c) 2017 Matthew Pare (paretech@gmail.com)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+
+
+import unittest
+
+
+class StateTrackerUpdate(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.constant = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.dynamic = f.read()
+
+    def test_update(self):
+        from klvdata.misb0601 import UASLocalMetadataSet
+        from klvdata.statetracker import StateTracker
+
+        first = UASLocalMetadataSet(self.constant[18:])
+        second = UASLocalMetadataSet(self.dynamic[17:])
+
+        tracker = StateTracker()
+
+        self.assertEqual(tracker.update(first), set(first.items))
+        self.assertEqual(tracker.metadata, first.MetadataList())
+
+        # Dynamic only packet changes the checksum and sensor relative azimuth,
+        # static items are kept.
+        self.assertEqual(tracker.update(second), {b'\x01', b'\x14'})
+        self.assertEqual(tracker.changed, {b'\x01', b'\x14'})
+        self.assertEqual(list(tracker.state), list(first.items))
+        self.assertIs(tracker.state[b'\x0d'], second[b'\x0d'])
+        self.assertIs(tracker.state[b'\x03'], first[b'\x03'])
+
+    def test_changed(self):
+        from klvdata.misb0601 import UASLocalMetadataSet
+        from klvdata.statetracker import StateTracker
+
+        offset = self.dynamic.index(b'\x0d\x04') + 2
+        moved = self.dynamic[:offset] + b'\x10\x00\x00\x00' + self.dynamic[offset + 4:]
+
+        tracker = StateTracker()
+        tracker.update(UASLocalMetadataSet(self.constant[18:]))
+        packet = UASLocalMetadataSet(moved[17:])
+
+        self.assertEqual(tracker.update(packet), {b'\x01', b'\x0d', b'\x14'})
+        self.assertEqual(tracker.metadata[13][3], str(packet[b'\x0d'].value.value))
+
+    def test_plain(self):
+        from klvdata.misb0601 import UASLocalMetadataSet
+        from klvdata.statetracker import StateTracker
+
+        tracker = StateTracker()
+        tracker.update(UASLocalMetadataSet.decode(self.constant[18:]))
+
+        self.assertEqual(tracker.update(UASLocalMetadataSet.decode(self.dynamic[17:])), {b'\x01', b'\x14'})
+        self.assertEqual(tracker.state[b'\x03'], 'Mission 12')
+        self.assertEqual(tracker.metadata, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -39,6 +39,181 @@ class ParserSingleLong(unittest.TestCase):
             # packet.structure()
             pass
 
+    def test_zero_copy(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            data = f.read()
+
+        from klvdata.streamparser import StreamParser
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        packets = list(StreamParser(bytearray(data * 2), zero_copy=True))
+        self.assertEqual(len(packets), 2)
+        self.assertIsInstance(packets[0], UASLocalMetadataSet)
+        self.assertEqual(bytes(packets[1]), data)
+
+    def test_resync(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            data = f.read()
+
+        from klvdata.streamparser import StreamParser
+
+        parser = StreamParser(data[:100] + data, resync=True)
+        packets = list(parser)
+
+        self.assertEqual(len(packets), 1)
+        self.assertEqual(bytes(packets[0]), data)
+        self.assertEqual(parser.skipped, [(0, 100)])
+
+    def test_keys(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            data = f.read()
+
+        from klvdata.streamparser import StreamParser
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        other = b'\x06\x0e\x2b\x34' + b'\x01' * 12 + b'\x04abcd'
+
+        packets = list(StreamParser(other + data + other, keys={UASLocalMetadataSet.key}))
+        self.assertEqual(len(packets), 1)
+        self.assertIsInstance(packets[0], UASLocalMetadataSet)
+
+    def test_lazy(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            data = f.read()
+
+        from klvdata.streamparser import StreamParser
+
+        packet = next(StreamParser(data, lazy=True))
+        self.assertTrue(packet.lazy)
+        self.assertEqual(packet.MetadataList(), next(StreamParser(data)).MetadataList())
+
+    def test_tags(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            data = f.read()
+
+        from klvdata.streamparser import StreamParser
+
+        packet = next(StreamParser(data, tags={2, 13, 14, 15}))
+        self.assertEqual(sorted(packet.MetadataList()), [2, 13, 14, 15])
+
+    def test_plain(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            data = f.read()
+
+        from klvdata.streamparser import StreamParser
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        packet = next(StreamParser(data, plain=True))
+        self.assertEqual(packet, UASLocalMetadataSet.decode(data[18:]))
+
+    def test_validate_checksum(self):
+        # The checksum of DynamicConstantMISMMSPacketData does not match.
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            bad = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            good = f.read()
+
+        from klvdata.streamparser import StreamParser
+
+        # Same packet with a non minimal BER Long Form length and its checksum.
+        long_form = bytearray(good[:16] + b'\x82\x00' + good[16:])
+        long_form[-2:] = ((int.from_bytes(good[-2:], 'big') + 0x8200) & 0xFFFF).to_bytes(2, 'big')
+
+        data = good + bad + bytes(long_form)
+
+        for zero_copy in (False, True):
+            with self.subTest(zero_copy=zero_copy):
+                parser = StreamParser(data, zero_copy=zero_copy, validate_checksum=True)
+                packets = list(parser)
+                self.assertEqual(len(packets), 2)
+                self.assertEqual(bytes(packets[0]), good)
+                self.assertEqual(parser.invalid, [(len(good), len(bad))])
+
+        parser = StreamParser(data, validate_checksum='flag')
+        self.assertEqual(len(list(parser)), 3)
+        self.assertEqual(parser.invalid, [(len(good), len(bad))])
+
+
+class FeedParserFragments(unittest.TestCase):
+    def setUp(self):
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            self.constant = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            self.dynamic = f.read()
+
+        self.stream = (self.constant + self.dynamic) * 3
+
+    def test_fragments(self):
+        from klvdata.streamparser import FeedParser
+        from klvdata.streamparser import StreamParser
+
+        expected = [bytes(packet) for packet in StreamParser(self.stream)]
+
+        for size in (1, 5, 17, 100, len(self.stream)):
+            with self.subTest(size=size):
+                parser = FeedParser()
+                packets = []
+
+                for i in range(0, len(self.stream), size):
+                    packets.extend(parser.feed(self.stream[i:i + size]))
+
+                self.assertEqual([bytes(packet) for packet in packets], expected)
+                self.assertEqual(parser.pending, 0)
+
+    def test_partial(self):
+        from klvdata.streamparser import FeedParser
+        from klvdata.misb0601 import UASLocalMetadataSet
+
+        parser = FeedParser()
+
+        self.assertEqual(parser.feed(self.constant[:17]), [])
+        self.assertEqual(parser.feed(self.constant[17:-1]), [])
+        self.assertEqual(parser.pending, len(self.constant) - 1)
+
+        packets = parser.feed(self.constant[-1:] + self.dynamic[:10])
+        self.assertEqual(len(packets), 1)
+        self.assertIsInstance(packets[0], UASLocalMetadataSet)
+        self.assertEqual(parser.pending, 10)
+
+
+class AsyncStreamParserReader(unittest.TestCase):
+    def test_reader(self):
+        import asyncio
+        from klvdata.streamparser import AsyncStreamParser
+        from klvdata.streamparser import StreamParser
+
+        with open('./data/DynamicConstantMISMMSPacketData.bin', 'rb') as f:
+            constant = f.read()
+
+        with open('./data/DynamicOnlyMISMMSPacketData.bin', 'rb') as f:
+            dynamic = f.read()
+
+        stream = (constant + dynamic) * 3
+
+        async def collect():
+            reader = asyncio.StreamReader()
+
+            for i in range(0, len(stream), 50):
+                reader.feed_data(stream[i:i + 50])
+            reader.feed_eof()
+
+            packets = []
+            async for packet in AsyncStreamParser(reader, block_size=64):
+                packets.append(packet)
+
+            return packets
+
+        loop = asyncio.new_event_loop()
+        try:
+            packets = loop.run_until_complete(collect())
+        finally:
+            loop.close()
+
+        self.assertEqual([bytes(packet) for packet in packets],
+                         [bytes(packet) for packet in StreamParser(stream)])
+
 
 if __name__ == "__main__":
     unittest.main()